@@ -0,0 +1,41 @@
+"""Ahead-of-time compile the vertex cover bitmask kernels with numba.pycc.
+
+Run ``python NPComplete/_kernels_build.py`` once to produce the ``_np_kernels``
+extension module next to this file. protein_network prefers it over the JIT
+kernels, so benchmark runs skip numba's per-process compile warm-up (and the
+exact solvers stay compiled even where numba itself is not installed).
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+try:
+    from numba.pycc import CC
+except ImportError as exc:  # pragma: no cover
+    raise SystemExit("numba is required to build the kernels; install with `pip install numba`.") from exc
+
+try:
+    from NPComplete.protein_network import _bf_min_cover, _bnb_min_cover
+except ImportError:  # pragma: no cover
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from NPComplete.protein_network import _bf_min_cover, _bnb_min_cover
+
+cc = CC("_np_kernels")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+
+@cc.export("bf_min_cover", "i8(i8, i8[:])")
+def bf_min_cover(n, edge_masks):
+    return _bf_min_cover(n, edge_masks)
+
+
+@cc.export("bnb_min_cover", "i8(i8, i8[:])")
+def bnb_min_cover(n, adj):
+    return _bnb_min_cover(n, adj)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"WROTE: {cc.output_dir}")
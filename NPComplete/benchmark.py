@@ -2,18 +2,23 @@
 
 Proteins correspond to vertices and interactions correspond to edges; a vertex
 cover is a minimal drug-target set blocking every interaction. Algorithms:
-edge-based 2-approximation (O(V + E)), degree-based greedy (O(V^2 + E)), and an
-exact brute-force solver (O(2^n · poly(n))) for small graphs. Results are
-written to CSV with summary plots for inclusion in reports.
+edge-based 2-approximation (O(V + E)), degree-based greedy (O((V + E) log V)),
+and an exact branch-and-bound solver (exponential worst case) for small graphs.
+Results are written to CSV with summary plots for inclusion in reports.
 """
 
 from __future__ import annotations
 
 import argparse
+import gc
+import os
 import sys
+from multiprocessing import Pool
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 try:
     import pandas as pd
@@ -34,6 +39,20 @@ except ImportError:  # pragma: no cover
     sys.path.append(str(Path(__file__).resolve().parent.parent))
     from NPComplete.protein_network import ProteinInteractionNetwork
 
+RESULT_COLUMNS = (
+    "n",
+    "m",
+    "replicate",
+    "alg_name",
+    "cover_size",
+    "runtime_ms",
+    "is_cover",
+    "optimal_size",
+    "approx_ratio",
+)
+
+GREEDY_ALGS = ["edge_2approx", "degree_greedy"]
+
 ALIAS = {
     "edge_2approx": "Edge-based 2-approx",
     "degree_greedy": "Degree-based greedy",
@@ -47,67 +66,128 @@ def generate_seed(base_seed: int, n: int, replicate: int) -> int:
     return base_seed + 1000 * n + replicate
 
 
+def time_call(func: Callable[..., Any], **kwargs: Any) -> Tuple[Any, float]:
+    """Return (result, runtime_ms) for one timed call of func(**kwargs).
+
+    The call is made once untimed first (JIT compilation, page faults, caches),
+    and the garbage collector is paused for the measured call to cut jitter.
+    """
+
+    func(**kwargs)
+    gc.collect()
+    gc.disable()
+    try:
+        start = perf_counter()
+        result = func(**kwargs)
+        runtime_ms = (perf_counter() - start) * 1000
+    finally:
+        gc.enable()
+    return result, runtime_ms
+
+
+def pin_to_cpu(cpu: int) -> bool:
+    """Pin this process to one CPU; False if unsupported.
+
+    Processes forked afterwards inherit the same single CPU, so pinned runs
+    should not use a worker pool.
+    """
+
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+    os.sched_setaffinity(0, {cpu})
+    return True
+
+
 def run_benchmarks(
-    sizes: List[int], m: int, replicates: int, base_seed: int
+    sizes: List[int],
+    m: int,
+    replicates: int,
+    base_seed: int,
+    verify: bool = False,
+    workers: Optional[int] = 1,
 ) -> pd.DataFrame:
-    """Run benchmarks across graph sizes and replicates, returning a DataFrame."""
-
-    records: List[Dict[str, Any]] = []
-
-    for n in sizes:
-        for rep in range(replicates):
-            seed = generate_seed(base_seed, n, rep)
-            ppi = ProteinInteractionNetwork.from_barabasi_albert(n=n, m=m, seed=seed)
-            stats = ppi.stats()
-            optimal_size: Optional[int] = None
-
-            if n <= 16:
-                start_opt = perf_counter()
-                opt_cover = ppi.brute_force_optimal_vertex_cover(max_n=16)
-                runtime_ms = (perf_counter() - start_opt) * 1000
-                if opt_cover is not None:
-                    optimal_size = len(opt_cover)
-                    records.append(
-                        {
-                            "n": n,
-                            "m": stats["m"],
-                            "replicate": rep,
-                            "alg_name": "optimal",
-                            "cover_size": optimal_size,
-                            "runtime_ms": runtime_ms,
-                            "is_cover": True,
-                            "optimal_size": optimal_size,
-                            "approx_ratio": 1.0,
-                        }
-                    )
-
-            algorithms = [
-                ("edge_2approx", ppi.greedy_vertex_cover_edge_based, {"seed": seed}),
-                ("degree_greedy", ppi.greedy_vertex_cover_degree_based, {}),
-            ]
-
-            for alg_name, func, kwargs in algorithms:
-                start = perf_counter()
-                cover = func(**kwargs)
-                runtime_ms = (perf_counter() - start) * 1000
-                cover_size = len(cover)
-                is_cover = ppi.is_vertex_cover(cover)
-                approx_ratio = (cover_size / optimal_size) if optimal_size else None
-                records.append(
-                    {
-                        "n": n,
-                        "m": stats["m"],
-                        "replicate": rep,
-                        "alg_name": alg_name,
-                        "cover_size": cover_size,
-                        "runtime_ms": runtime_ms,
-                        "is_cover": is_cover,
-                        "optimal_size": optimal_size,
-                        "approx_ratio": approx_ratio,
-                    }
-                )
-
-    return pd.DataFrame(records)
+    """Run benchmarks across graph sizes and replicates, returning a DataFrame.
+
+    When verify is set, every greedy cover is re-checked with is_vertex_cover;
+    otherwise is_cover is recorded as True (both algorithms always return covers).
+    By default every (n, replicate) pair is timed in-process, one after another.
+    workers > 1 (or None for os.cpu_count()) dispatches the pairs to a process
+    pool instead, which is faster but adds cross-process contention to the
+    recorded runtimes.
+    """
+
+    tasks = [(n, rep, m, base_seed, verify) for n in sizes for rep in range(replicates)]
+    if workers == 1:
+        parts = [_run_one(*task) for task in tasks]
+    else:
+        with Pool(workers) as pool:
+            parts = pool.starmap(_run_one, tasks)
+
+    columns = {name: [value for part in parts for value in part[name]] for name in RESULT_COLUMNS}
+    return _columns_to_frame(columns)
+
+
+def _run_one(n: int, rep: int, m: int, base_seed: int, verify: bool) -> Dict[str, List[Any]]:
+    """Benchmark every algorithm on one generated graph, returning per-column lists."""
+
+    columns: Dict[str, List[Any]] = {name: [] for name in RESULT_COLUMNS}
+
+    def add_row(*values: Any) -> None:
+        for name, value in zip(RESULT_COLUMNS, values):
+            columns[name].append(value)
+
+    seed = generate_seed(base_seed, n, rep)
+    ppi = ProteinInteractionNetwork.from_barabasi_albert(n=n, m=m, seed=seed)
+    stats = ppi.stats()
+    optimal_size: Optional[int] = None
+
+    if n <= 16:
+        opt_cover, runtime_ms = time_call(ppi.branch_and_bound_vertex_cover, max_n=16)
+        if opt_cover is not None:
+            optimal_size = len(opt_cover)
+            add_row(n, stats["m"], rep, "optimal", optimal_size, runtime_ms, True, optimal_size, 1.0)
+
+    algorithms = [
+        ("edge_2approx", ppi.greedy_vertex_cover_edge_based, {"seed": seed}),
+        ("degree_greedy", ppi.greedy_vertex_cover_degree_based, {}),
+    ]
+
+    for alg_name, func, kwargs in algorithms:
+        cover, runtime_ms = time_call(func, **kwargs)
+        cover_size = len(cover)
+        is_cover = ppi.is_vertex_cover(cover) if verify else True
+        approx_ratio = (cover_size / optimal_size) if optimal_size else np.nan
+        add_row(
+            n,
+            stats["m"],
+            rep,
+            alg_name,
+            cover_size,
+            runtime_ms,
+            is_cover,
+            np.nan if optimal_size is None else optimal_size,
+            approx_ratio,
+        )
+
+    return columns
+
+
+def _columns_to_frame(columns: Dict[str, List[Any]]) -> pd.DataFrame:
+    """Build the results DataFrame from per-column lists with explicit dtypes."""
+
+    return pd.DataFrame(
+        {
+            "n": np.asarray(columns["n"], dtype=np.int32),
+            "m": np.asarray(columns["m"], dtype=np.int32),
+            "replicate": np.asarray(columns["replicate"], dtype=np.int32),
+            "alg_name": np.asarray(columns["alg_name"], dtype=object),
+            "cover_size": np.asarray(columns["cover_size"], dtype=np.int32),
+            "runtime_ms": np.asarray(columns["runtime_ms"], dtype=np.float64),
+            "is_cover": np.asarray(columns["is_cover"], dtype=bool),
+            "optimal_size": np.asarray(columns["optimal_size"], dtype=np.float64),
+            "approx_ratio": np.asarray(columns["approx_ratio"], dtype=np.float64),
+        }
+    )
 
 
 def save_results(df: pd.DataFrame, results_dir: Path) -> Path:
@@ -119,17 +199,36 @@ def save_results(df: pd.DataFrame, results_dir: Path) -> Path:
     return csv_path
 
 
-def plot_runtime(df: pd.DataFrame, figures_dir: Path) -> Path:
+def aggregate_for_plots(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate results once per (alg_name, n) for the plotting functions.
+
+    Columns: runtime_mean/std, size_mean/std, and ratio_mean with the number of
+    non-missing ratios (ratio_count) so per-algorithm means can be recovered.
+    """
+
+    return df.groupby(["alg_name", "n"]).agg(
+        runtime_mean=("runtime_ms", "mean"),
+        runtime_std=("runtime_ms", "std"),
+        size_mean=("cover_size", "mean"),
+        size_std=("cover_size", "std"),
+        ratio_mean=("approx_ratio", "mean"),
+        ratio_count=("approx_ratio", "count"),
+    )
+
+
+def plot_runtime(agg_df: pd.DataFrame, figures_dir: Path) -> Path:
     """Plot runtime (mean ± std) versus n for greedy algorithms."""
 
     fig, ax = plt.subplots()
-    for alg in ["edge_2approx", "degree_greedy"]:
-        subset = df[df["alg_name"] == alg]
-        grouped = subset.groupby("n")["runtime_ms"].agg(["mean", "std"]).reset_index()
+    present = agg_df.index.get_level_values("alg_name")
+    for alg in GREEDY_ALGS:
+        if alg not in present:
+            continue
+        grouped = agg_df.loc[alg]
         ax.errorbar(
-            grouped["n"],
-            grouped["mean"],
-            yerr=grouped["std"],
+            grouped.index,
+            grouped["runtime_mean"],
+            yerr=grouped["runtime_std"],
             marker="o",
             capsize=3,
             label=ALIAS[alg],
@@ -146,35 +245,35 @@ def plot_runtime(df: pd.DataFrame, figures_dir: Path) -> Path:
     return out_path
 
 
-def plot_cover_sizes(df: pd.DataFrame, figures_dir: Path) -> Path:
+def plot_cover_sizes(agg_df: pd.DataFrame, figures_dir: Path) -> Path:
     """Plot cover size (mean ± std) versus n, with optimal where available."""
 
     fig, ax = plt.subplots()
-    approx_means = (
-        df[df["approx_ratio"].notna()].groupby("alg_name")["approx_ratio"].mean().to_dict()
-    )
+    present = agg_df.index.get_level_values("alg_name")
 
-    for alg in ["edge_2approx", "degree_greedy"]:
-        subset = df[df["alg_name"] == alg]
-        grouped = subset.groupby("n")["cover_size"].agg(["mean", "std"]).reset_index()
+    for alg in GREEDY_ALGS:
+        if alg not in present:
+            continue
+        grouped = agg_df.loc[alg]
         label = ALIAS[alg]
-        if alg in approx_means:
-            label = f"{label} (mean approx {approx_means[alg]:.2f})"
+        ratio_count = grouped["ratio_count"].sum()
+        if ratio_count:
+            approx_mean = (grouped["ratio_mean"] * grouped["ratio_count"]).sum() / ratio_count
+            label = f"{label} (mean approx {approx_mean:.2f})"
         ax.errorbar(
-            grouped["n"],
-            grouped["mean"],
-            yerr=grouped["std"],
+            grouped.index,
+            grouped["size_mean"],
+            yerr=grouped["size_std"],
             marker="o",
             capsize=3,
             label=label,
         )
 
-    optimal_subset = df[df["alg_name"] == "optimal"]
-    if not optimal_subset.empty:
-        grouped_opt = optimal_subset.groupby("n")["cover_size"].mean().reset_index()
+    if "optimal" in present:
+        grouped_opt = agg_df.loc["optimal"]
         ax.plot(
-            grouped_opt["n"],
-            grouped_opt["cover_size"],
+            grouped_opt.index,
+            grouped_opt["size_mean"],
             marker="s",
             linestyle="--",
             label=ALIAS["optimal"],
@@ -192,30 +291,40 @@ def plot_cover_sizes(df: pd.DataFrame, figures_dir: Path) -> Path:
     return out_path
 
 
-def print_summary(df: pd.DataFrame) -> None:
-    """Print per-n averages of cover sizes and approximation ratios."""
+def summarize(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-n mean cover size and approximation ratio for each greedy algorithm.
 
-    header = "n | edge_size | degree_size | edge_ratio | degree_ratio"
-    print(header)
-    for n in sorted(df["n"].unique()):
-        edge_subset = df[(df["n"] == n) & (df["alg_name"] == "edge_2approx")]
-        degree_subset = df[(df["n"] == n) & (df["alg_name"] == "degree_greedy")]
+    Returns a wide frame indexed by n with (statistic, alg_name) columns, where
+    statistic is ``mean_size`` or ``mean_ratio``; missing values are NaN.
+    """
+
+    summary = (
+        df.groupby(["n", "alg_name"])
+        .agg(mean_size=("cover_size", "mean"), mean_ratio=("approx_ratio", "mean"))
+        .unstack("alg_name")
+    )
+    columns = pd.MultiIndex.from_product([["mean_size", "mean_ratio"], GREEDY_ALGS])
+    return summary.reindex(columns=columns).sort_index()
 
-        edge_mean = edge_subset["cover_size"].mean()
-        degree_mean = degree_subset["cover_size"].mean()
 
-        edge_ratio = edge_subset["approx_ratio"].dropna()
-        degree_ratio = degree_subset["approx_ratio"].dropna()
+def format_stat(value: float, spec: str) -> str:
+    """Format a summary value, rendering NaN as '-'."""
 
-        edge_ratio_mean = edge_ratio.mean() if not edge_ratio.empty else None
-        degree_ratio_mean = degree_ratio.mean() if not degree_ratio.empty else None
+    return f"{value:{spec}}" if value == value else "-"
 
+
+def print_summary(df: pd.DataFrame) -> None:
+    """Print per-n averages of cover sizes and approximation ratios."""
+
+    header = "n | edge_size | degree_size | edge_ratio | degree_ratio"
+    print(header)
+    for n, row in summarize(df).iterrows():
         parts = [
             str(n),
-            f"{edge_mean:.2f}" if edge_mean == edge_mean else "-",
-            f"{degree_mean:.2f}" if degree_mean == degree_mean else "-",
-            f"{edge_ratio_mean:.3f}" if edge_ratio_mean is not None else "-",
-            f"{degree_ratio_mean:.3f}" if degree_ratio_mean is not None else "-",
+            format_stat(row[("mean_size", "edge_2approx")], ".2f"),
+            format_stat(row[("mean_size", "degree_greedy")], ".2f"),
+            format_stat(row[("mean_ratio", "edge_2approx")], ".3f"),
+            format_stat(row[("mean_ratio", "degree_greedy")], ".3f"),
         ]
         print(" | ".join(parts))
 
@@ -238,6 +347,26 @@ def parse_args() -> argparse.Namespace:
         "--replicates", type=int, default=5, help="Replicates per size (default: 5)."
     )
     parser.add_argument("--base-seed", type=int, default=12345, help="Base seed for deterministic runs.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Benchmark worker processes (default: 1, timed in-process; 0 uses the CPU count). "
+            "More than one worker makes the recorded runtimes noisier."
+        ),
+    )
+    parser.add_argument(
+        "--pin-cpu",
+        type=int,
+        default=None,
+        help="Pin the benchmark to one CPU to reduce timing variance (Linux; implies --workers 1).",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Re-check every greedy cover with is_vertex_cover (default: off).",
+    )
     return parser.parse_args()
 
 
@@ -247,10 +376,21 @@ def main() -> None:
     figures_dir = base_dir / "figures"
     results_dir = base_dir / "results"
 
-    df = run_benchmarks(args.sizes, args.m, args.replicates, args.base_seed)
+    if args.pin_cpu is not None:
+        # Forked workers inherit the affinity, so a pool would share the one CPU.
+        if args.workers != 1:
+            print(f"--pin-cpu: running in-process on CPU {args.pin_cpu} (workers=1) instead of a worker pool.")
+            args.workers = 1
+        if not pin_to_cpu(args.pin_cpu):
+            print("CPU pinning is not supported on this platform; continuing unpinned.")
+
+    df = run_benchmarks(
+        args.sizes, args.m, args.replicates, args.base_seed, verify=args.verify, workers=args.workers or None
+    )
     save_results(df, results_dir)
-    plot_runtime(df, figures_dir)
-    plot_cover_sizes(df, figures_dir)
+    agg_df = aggregate_for_plots(df)
+    plot_runtime(agg_df, figures_dir)
+    plot_cover_sizes(agg_df, figures_dir)
     print_summary(df)
 
 
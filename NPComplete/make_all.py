@@ -37,8 +37,9 @@ def ensure_results(csv_path: Path) -> None:
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(csv_path, index=False)
     figures_dir = csv_path.parent.parent / "figures"
-    benchmark.plot_runtime(df, figures_dir)
-    benchmark.plot_cover_sizes(df, figures_dir)
+    agg_df = benchmark.aggregate_for_plots(df)
+    benchmark.plot_runtime(agg_df, figures_dir)
+    benchmark.plot_cover_sizes(agg_df, figures_dir)
 
 
 def build_figs_tex(figs_path: Path) -> None:
@@ -67,24 +68,11 @@ def build_tables_tex(csv_path: Path, table_path: Path) -> None:
 
     df = pd.read_csv(csv_path)
     rows: List[str] = []
-    for n in sorted(df["n"].unique()):
-        edge_subset = df[(df["n"] == n) & (df["alg_name"] == "edge_2approx")]
-        degree_subset = df[(df["n"] == n) & (df["alg_name"] == "degree_greedy")]
-
-        edge_mean = edge_subset["cover_size"].mean()
-        degree_mean = degree_subset["cover_size"].mean()
-
-        edge_ratio = edge_subset["approx_ratio"].dropna()
-        degree_ratio = degree_subset["approx_ratio"].dropna()
-
-        edge_ratio_mean = edge_ratio.mean() if not edge_ratio.empty else None
-        degree_ratio_mean = degree_ratio.mean() if not degree_ratio.empty else None
-
-        edge_ratio_str = f"{edge_ratio_mean:.3f}" if edge_ratio_mean is not None else "-"
-        degree_ratio_str = f"{degree_ratio_mean:.3f}" if degree_ratio_mean is not None else "-"
-
-        edge_mean_str = f"{edge_mean:.2f}" if edge_mean == edge_mean else "-"
-        degree_mean_str = f"{degree_mean:.2f}" if degree_mean == degree_mean else "-"
+    for n, row in benchmark.summarize(df).iterrows():
+        edge_mean_str = benchmark.format_stat(row[("mean_size", "edge_2approx")], ".2f")
+        degree_mean_str = benchmark.format_stat(row[("mean_size", "degree_greedy")], ".2f")
+        edge_ratio_str = benchmark.format_stat(row[("mean_ratio", "edge_2approx")], ".3f")
+        degree_ratio_str = benchmark.format_stat(row[("mean_ratio", "degree_greedy")], ".3f")
 
         rows.append(f"{n} & {edge_mean_str} & {degree_mean_str} & {edge_ratio_str} & {degree_ratio_str} \\\\")
 
@@ -114,9 +102,9 @@ def main() -> None:
     ensure_results(csv_path)
 
     # Regenerate plots in case results existed but plots missing/stale.
-    df = pd.read_csv(csv_path)
-    benchmark.plot_runtime(df, figures_dir)
-    benchmark.plot_cover_sizes(df, figures_dir)
+    agg_df = benchmark.aggregate_for_plots(pd.read_csv(csv_path))
+    benchmark.plot_runtime(agg_df, figures_dir)
+    benchmark.plot_cover_sizes(agg_df, figures_dir)
 
     figs_path = appendix_dir / "figs.tex"
     build_figs_tex(figs_path)
@@ -3,16 +3,209 @@
 Proteins correspond to vertices and pairwise interactions correspond to undirected
 edges; a vertex cover is a minimal drug-target set that disrupts every interaction.
 Algorithms provided: edge-based greedy 2-approximation (O(V + E)), degree-based
-greedy heuristic (O(V^2 + E)), and a brute-force exact solver (O(2^n · poly(n)))
-for small instances. Includes a Barabási–Albert generator with a deterministic
-fallback when networkx is unavailable.
+greedy heuristic (O((V + E) log V)), a brute-force exact solver (O(2^n · poly(n)))
+for small instances, and a branch-and-reduce exact solver that prunes with a
+degree-sum lower bound. Includes a Barabási–Albert generator with a deterministic
+fallback when networkx is unavailable. The exact solvers' bitmask kernels use the
+ahead-of-time ``_np_kernels`` extension if it has been built, are JIT-compiled
+with numba when it is installed, and run as plain Python otherwise.
 """
 
 from __future__ import annotations
 
-import random
+import heapq
 from itertools import combinations
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import networkx as nx  # type: ignore
+except ImportError:  # pragma: no cover
+    nx = None
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Identity decorator used when numba is not installed."""
+
+        def decorate(func):
+            return func
+
+        return decorate
+
+# numba's on-disk cache records the defining module name, so only cache kernels
+# when imported as NPComplete.protein_network (not when run as a script).
+_JIT_CACHE = __name__ != "__main__"
+
+# Bitmask kernels keep vertex sets in signed 64-bit integers; capping n here keeps
+# 1 << n (and Gosper's intermediate r) representable.
+MAX_MASK_BITS = 62
+
+
+@njit(cache=_JIT_CACHE)
+def _bf_min_cover(n, edge_masks):
+    """Return the bitmask of a minimum vertex cover of an n-vertex graph.
+
+    Each edge is encoded as (1 << u) | (1 << v), so a mask covers the edge iff
+    their AND is non-zero. Enumerates masks by increasing popcount (Gosper's hack)
+    and returns the first that covers every edge. Requires n <= MAX_MASK_BITS.
+    """
+
+    if edge_masks.shape[0] == 0:
+        return 0
+    limit = 1 << n
+    for k in range(1, n + 1):
+        mask = (1 << k) - 1
+        while mask < limit:
+            covered = True
+            for em in edge_masks:
+                if (em & mask) == 0:
+                    covered = False
+                    break
+            if covered:
+                return mask
+            # Gosper's hack: next larger mask with the same popcount.
+            c = mask & -mask
+            r = mask + c
+            mask = (((r ^ mask) >> 2) // c) | r
+    return limit - 1
+
+
+@njit(cache=_JIT_CACHE)
+def _popcount(x):
+    """Number of set bits in a non-negative 64-bit mask (SWAR reduction)."""
+
+    x = x - ((x >> 1) & 0x5555555555555555)
+    x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
+    x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
+    x = x + (x >> 8)
+    x = x + (x >> 16)
+    x = x + (x >> 32)
+    return x & 0x7F
+
+
+@njit(cache=_JIT_CACHE)
+def _bnb_min_cover(n, adj):
+    """Return the bitmask of a minimum vertex cover by branch-and-reduce.
+
+    ``adj[v]`` is the neighbor bitmask of vertex v. Each search node holds the
+    still-undecided vertices (``alive``) and the partial cover. Reductions: an
+    isolated vertex is dropped, the neighbor of a degree-1 vertex is taken, and a
+    neighbor u of v with N[v] ⊆ N[u] is taken. The node is pruned when the cover
+    size plus a degree-sum lower bound reaches the incumbent; otherwise it branches
+    on a maximum-degree vertex v: take v, or take all of N(v). Requires
+    n <= MAX_MASK_BITS.
+    """
+
+    best = (1 << n) - 1
+    best_size = n
+    # Every branch removes at least one vertex, so depth <= n and each level
+    # leaves at most one pending sibling.
+    stack_alive = np.empty(n + 2, dtype=np.int64)
+    stack_cover = np.empty(n + 2, dtype=np.int64)
+    degrees = np.empty(max(n, 1), dtype=np.int64)
+    stack_alive[0] = best
+    stack_cover[0] = 0
+    top = 1
+
+    while top > 0:
+        top -= 1
+        alive = stack_alive[top]
+        cover = stack_cover[top]
+
+        changed = True
+        while changed:
+            changed = False
+            rest = alive
+            while rest != 0:
+                low = rest & -rest
+                rest ^= low
+                if (alive & low) == 0:
+                    continue
+                v = _popcount(low - 1)
+                nbrs = adj[v] & alive
+                if nbrs == 0:
+                    alive ^= low
+                    continue
+                if (nbrs & (nbrs - 1)) == 0:
+                    cover |= nbrs
+                    alive &= ~(nbrs | low)
+                    changed = True
+                    continue
+                closed_v = nbrs | low
+                others = nbrs
+                while others != 0:
+                    u_bit = others & -others
+                    others ^= u_bit
+                    u = _popcount(u_bit - 1)
+                    if (closed_v & ~((adj[u] & alive) | u_bit)) == 0:
+                        cover |= u_bit
+                        alive &= ~u_bit
+                        changed = True
+                        break
+
+        size = _popcount(cover)
+        if size >= best_size:
+            continue
+
+        count = 0
+        degree_sum = 0
+        max_degree = 0
+        branch_v = -1
+        rest = alive
+        while rest != 0:
+            low = rest & -rest
+            rest ^= low
+            v = _popcount(low - 1)
+            d = _popcount(adj[v] & alive)
+            degrees[count] = d
+            count += 1
+            degree_sum += d
+            if d > max_degree:
+                max_degree = d
+                branch_v = v
+        if degree_sum == 0:
+            best = cover
+            best_size = size
+            continue
+
+        # Lower bound: fewest vertices whose degrees can sum to the edge count.
+        remaining_edges = degree_sum // 2
+        ordered = np.sort(degrees[:count])
+        bound = 0
+        covered = 0
+        while covered < remaining_edges:
+            covered += ordered[count - 1 - bound]
+            bound += 1
+        if size + bound >= best_size:
+            continue
+
+        v_bit = 1 << branch_v
+        nbrs = adj[branch_v] & alive
+        stack_alive[top] = alive & ~(nbrs | v_bit)
+        stack_cover[top] = cover | nbrs
+        top += 1
+        stack_alive[top] = alive & ~v_bit
+        stack_cover[top] = cover | v_bit
+        top += 1
+
+    return best
+
+
+try:
+    # Ahead-of-time build of the kernels above (see _kernels_build.py).
+    from ._np_kernels import bf_min_cover as _bf_kernel, bnb_min_cover as _bnb_kernel
+
+    AOT_KERNELS = True
+except ImportError:
+    _bf_kernel, _bnb_kernel = _bf_min_cover, _bnb_min_cover
+    AOT_KERNELS = False
 
 
 class ProteinInteractionNetwork:
@@ -26,23 +219,56 @@ class ProteinInteractionNetwork:
         """Initialize the network with validation.
 
         Ensures endpoints exist, forbids self-loops, and ignores duplicate edges.
-        Adjacency is stored as a mapping from protein to a set of neighboring proteins.
+        Proteins are interned to integer ids 0..n-1 in sorted label order and
+        adjacency is stored in CSR form: the neighbors of vertex i are
+        ``indices[indptr[i]:indptr[i + 1]]`` (sorted ascending).
         """
 
-        self._vertices: Set[str] = set(proteins)
-        if not self._vertices and interactions:
+        vertex_set: Set[str] = set(proteins)
+        if not vertex_set and interactions:
             raise ValueError("Cannot add interactions without proteins.")
 
-        self._adjacency: Dict[str, Set[str]] = {p: set() for p in self._vertices}
+        self._labels: Tuple[str, ...] = tuple(sorted(vertex_set))
+        self._ids: Dict[str, int] = {p: i for i, p in enumerate(self._labels)}
+
+        edge_set: Set[Tuple[int, int]] = set()
         for u, v in interactions:
             if u == v:
                 raise ValueError(f"Self-loop detected on {u}.")
-            if u not in self._vertices or v not in self._vertices:
+            if u not in self._ids or v not in self._ids:
                 raise ValueError(f"Interaction ({u}, {v}) references unknown protein(s).")
-            if v in self._adjacency[u]:
-                continue  # ignore duplicates
-            self._adjacency[u].add(v)
-            self._adjacency[v].add(u)
+            a, b = self._ids[u], self._ids[v]
+            edge_set.add((a, b) if a < b else (b, a))  # duplicates collapse here
+
+        n = len(self._labels)
+        edge_pairs = sorted(edge_set)
+        # The graph is immutable after construction, so label views are built once.
+        self._edges_sorted: Tuple[Tuple[str, str], ...] = tuple(
+            (self._labels[u], self._labels[v]) for u, v in edge_pairs
+        )
+        self._src = np.array([u for u, _ in edge_pairs], dtype=np.int32)
+        self._dst = np.array([v for _, v in edge_pairs], dtype=np.int32)
+
+        # Degree counts -> prefix sum -> scatter neighbors (both directions).
+        heads = np.concatenate((self._src, self._dst))
+        tails = np.concatenate((self._dst, self._src))
+        degree = np.bincount(heads, minlength=n)
+        self._indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(degree, out=self._indptr[1:])
+        order = np.lexsort((tails, heads))
+        self._indices = tails[order].astype(np.int32, copy=False)
+        # Vertex -> incident edge ids, sharing indptr with the neighbor lists.
+        edge_ids = np.arange(len(edge_pairs), dtype=np.int32)
+        self._incident_edges = np.concatenate((edge_ids, edge_ids))[order]
+
+        m = len(edge_pairs)
+        self._stats: Dict[str, float] = {
+            "n": n,
+            "m": m,
+            "density": 0.0 if n <= 1 else 2.0 * m / (n * (n - 1)),
+            "max_degree": int(degree.max()) if n else 0,
+            "avg_degree": 0.0 if n == 0 else 2.0 * m / n,
+        }
 
     @staticmethod
     def from_barabasi_albert(
@@ -50,23 +276,23 @@ class ProteinInteractionNetwork:
     ) -> "ProteinInteractionNetwork":
         """Generate a preferential-attachment PPI network.
 
-        Prefers networkx.barabasi_albert_graph; otherwise uses a deterministic
-        degree-proportional fallback. Node labels are f"{prefix}{i}".
+        Prefers networkx.barabasi_albert_graph; uses a deterministic
+        degree-proportional fallback when networkx is not installed or m >= n.
+        Node labels are f"{prefix}{i}".
         """
 
         if n <= 0 or m <= 0:
             raise ValueError("n and m must be positive integers.")
 
-        try:
-            import networkx as nx  # type: ignore
-
-            g = nx.barabasi_albert_graph(n=n, m=m, seed=seed)
-            proteins = [f"{prefix}{i}" for i in range(n)]
-            edges = [(proteins[u], proteins[v]) for u, v in g.edges()]
-            return ProteinInteractionNetwork(proteins, edges)
-        except Exception:
+        if nx is None or m >= n:
+            # networkx requires m < n; the fallback seeds a clique on min(n, m + 1) nodes.
             return ProteinInteractionNetwork._fallback_barabasi_albert(n, m, seed, prefix)
 
+        g = nx.barabasi_albert_graph(n=n, m=m, seed=seed)
+        proteins = [f"{prefix}{i}" for i in range(n)]
+        edges = [(proteins[u], proteins[v]) for u, v in g.edges()]
+        return ProteinInteractionNetwork(proteins, edges)
+
     @staticmethod
     def _fallback_barabasi_albert(
         n: int, m: int, seed: int, prefix: str
@@ -75,10 +301,11 @@ class ProteinInteractionNetwork:
 
         Starts from a clique on min(n, m + 1) nodes, then adds nodes one by one,
         connecting each new node to m existing nodes sampled with probability
-        proportional to degree (implemented via the repeated-nodes list trick).
+        proportional to degree (implemented via the repeated-nodes array trick, with
+        candidates drawn in bulk from a NumPy Generator).
         """
 
-        rng = random.Random(seed)
+        rng = np.random.default_rng(seed)
         node_count = n
         base = min(n, max(2, m + 1))
         edges: Set[Tuple[int, int]] = set()
@@ -88,23 +315,36 @@ class ProteinInteractionNetwork:
             for j in range(i + 1, base):
                 edges.add((i, j))
 
-        repeated_nodes: List[int] = []
+        # Each node appears once per incident edge end; the final length is bounded
+        # by the clique plus 2m entries per attached node, so allocate once.
+        capacity = base * (base - 1) + 2 * m * max(0, node_count - base)
+        repeated_nodes = np.empty(capacity, dtype=np.int32)
+        filled = 0
         for i in range(base):
             # In a clique of size base, degree is base-1.
-            repeated_nodes.extend([i] * (base - 1))
+            repeated_nodes[filled : filled + base - 1] = i
+            filled += base - 1
 
         # Attach remaining nodes preferentially.
         for new_node in range(base, node_count):
-            targets: Set[int] = set()
-            while len(targets) < m and repeated_nodes:
-                targets.add(rng.choice(repeated_nodes))
+            targets: List[int] = []
+            while len(targets) < m and filled:
+                # Draw candidates in bulk and keep distinct ones in draw order.
+                draws = repeated_nodes[rng.integers(0, filled, size=2 * m)]
+                _, first = np.unique(draws, return_index=True)
+                for t in draws[np.sort(first)].tolist():
+                    if t not in targets:
+                        targets.append(t)
+                        if len(targets) == m:
+                            break
             if not targets:
-                targets = set(rng.sample(range(new_node), k=min(m, new_node)))
+                targets = rng.choice(new_node, size=min(m, new_node), replace=False).tolist()
             for t in targets:
-                u, v = sorted((new_node, t))
-                edges.add((u, v))
-            repeated_nodes.extend(targets)
-            repeated_nodes.extend([new_node] * max(len(targets), m))
+                edges.add((t, new_node))
+            repeated_nodes[filled : filled + len(targets)] = targets
+            filled += len(targets)
+            repeated_nodes[filled : filled + max(len(targets), m)] = new_node
+            filled += max(len(targets), m)
 
         proteins = [f"{prefix}{i}" for i in range(node_count)]
         labeled_edges = [(proteins[u], proteins[v]) for u, v in edges]
@@ -113,130 +353,148 @@ class ProteinInteractionNetwork:
     def vertices(self) -> List[str]:
         """Return proteins in deterministic sorted order."""
 
-        return sorted(self._vertices)
+        return list(self._labels)
 
     def edges(self) -> List[Tuple[str, str]]:
         """Return edges as sorted pairs in deterministic order."""
 
-        edge_list: List[Tuple[str, str]] = []
-        for u in self.vertices():
-            for v in sorted(self._adjacency[u]):
-                if u < v:
-                    edge_list.append((u, v))
-        return edge_list
+        return list(self._edges_sorted)
 
     def stats(self) -> Dict[str, float]:
-        """Compute basic graph statistics."""
-
-        n = len(self._vertices)
-        m = sum(len(neigh) for neigh in self._adjacency.values()) // 2
-        density = 0.0 if n <= 1 else 2.0 * m / (n * (n - 1))
-        degrees = [len(neigh) for neigh in self._adjacency.values()]
-        max_degree = max(degrees) if degrees else 0
-        avg_degree = 0.0 if n == 0 else sum(degrees) / n
-        return {
-            "n": n,
-            "m": m,
-            "density": density,
-            "max_degree": max_degree,
-            "avg_degree": avg_degree,
-        }
+        """Return basic graph statistics (computed once at construction)."""
+
+        return self._stats.copy()
 
     def is_vertex_cover(self, cover: Set[str]) -> bool:
         """Return True iff every interaction has an endpoint in cover."""
 
-        for u in self._vertices:
-            for v in self._adjacency[u]:
-                if u < v and u not in cover and v not in cover:
-                    return False
-        return True
+        cover_mask = np.zeros(len(self._labels), dtype=bool)
+        cover_mask[list(self._to_ids(cover))] = True
+        return bool((cover_mask[self._src] | cover_mask[self._dst]).all())
 
     def greedy_vertex_cover_edge_based(self, seed: int = 42) -> Set[str]:
         """Edge-based 2-approximation in O(V + E) time.
 
         Repeatedly select an uncovered edge (deterministic randomness via seed),
         add both endpoints to the cover, and remove all incident uncovered edges.
+        Edges are visited once in a seeded random order, skipping those already
+        covered, which picks uniformly among the uncovered edges at every step.
         """
 
-        rng = random.Random(seed)
-        cover: Set[str] = set()
-        edges = self.edges()
-        vertex_to_edges: Dict[str, Set[int]] = {v: set() for v in self._vertices}
-        for idx, (u, v) in enumerate(edges):
-            vertex_to_edges[u].add(idx)
-            vertex_to_edges[v].add(idx)
-
-        active: List[int] = list(range(len(edges)))
-        positions: Dict[int, int] = {idx: idx for idx in active}
-
-        def remove_edge_idx(idx: int) -> None:
-            pos = positions.pop(idx, None)
-            if pos is None:
-                return
-            last = active.pop()
-            if pos < len(active):
-                active[pos] = last
-                positions[last] = pos
-
-        while active:
-            idx = rng.choice(active)
-            u, v = edges[idx]
+        num_edges = len(self._src)
+        order = np.random.default_rng(seed).permutation(num_edges).astype(np.int32)
+        alive = np.ones(num_edges, dtype=bool)
+        src, dst = self._src.tolist(), self._dst.tolist()
+        indptr, incident = self._indptr.tolist(), self._incident_edges
+        cover: Set[int] = set()
+
+        for idx in order.tolist():
+            if not alive[idx]:
+                continue
+            u, v = src[idx], dst[idx]
             cover.update((u, v))
-            for vertex in (u, v):
-                incident = list(vertex_to_edges[vertex])
-                for e_idx in incident:
-                    remove_edge_idx(e_idx)
-                    other = edges[e_idx][0] if edges[e_idx][1] == vertex else edges[e_idx][1]
-                    vertex_to_edges[other].discard(e_idx)
-                vertex_to_edges[vertex].clear()
-        return cover
+            alive[incident[indptr[u] : indptr[u + 1]]] = False
+            alive[incident[indptr[v] : indptr[v + 1]]] = False
+        return self._to_labels(cover)
 
     def greedy_vertex_cover_degree_based(self) -> Set[str]:
-        """Degree-based greedy heuristic in O(V^2 + E) time.
+        """Degree-based greedy heuristic in O((V + E) log V) time.
 
         Each iteration selects a current maximum-degree protein (lexicographically
         smallest among ties), adds it to the cover, and deletes incident edges.
+        A lazy max-heap keyed by (-degree, id) skips entries made stale by deletions.
         """
 
-        remaining: Dict[str, Set[str]] = {v: set(neigh) for v, neigh in self._adjacency.items()}
-        cover: Set[str] = set()
-
-        while True:
-            degrees = {v: len(neigh) for v, neigh in remaining.items()}
-            if not degrees:
+        indptr, indices = self._indptr, self._indices
+        degrees = np.diff(indptr).astype(np.int32)
+        heap = [(-d, v) for v, d in enumerate(degrees.tolist())]
+        heapq.heapify(heap)
+        cover: Set[int] = set()
+
+        while heap:
+            neg_degree, chosen = heapq.heappop(heap)
+            if -neg_degree != degrees[chosen]:
+                continue  # stale entry; a fresher one is still queued
+            if neg_degree == 0:
                 break
-            max_degree = max(degrees.values()) if degrees else 0
-            if max_degree == 0:
-                break
-            candidates = [v for v, deg in degrees.items() if deg == max_degree]
-            chosen = min(candidates)
             cover.add(chosen)
-            for nbr in list(remaining[chosen]):
-                remaining[nbr].discard(chosen)
-            remaining[chosen].clear()
-        return cover
+            for nbr in indices[indptr[chosen] : indptr[chosen + 1]].tolist():
+                if nbr not in cover:
+                    degrees[nbr] -= 1
+                    heapq.heappush(heap, (-int(degrees[nbr]), nbr))
+            degrees[chosen] = 0
+        return self._to_labels(cover)
 
     def brute_force_optimal_vertex_cover(self, max_n: int = 18) -> Optional[Set[str]]:
         """Exact minimum vertex cover by size-ordered enumeration.
 
         Returns None when the instance exceeds max_n to avoid exponential work.
         Otherwise enumerates subsets by increasing size and returns the first cover.
+        With numba the enumeration runs over bitmasks in a compiled kernel.
         """
 
-        vertices = self.vertices()
-        if len(vertices) > max_n:
+        n = len(self._labels)
+        if n > max_n:
             return None
-        edge_list = self.edges()
-        for k in range(len(vertices) + 1):
-            for subset in combinations(vertices, k):
-                candidate = set(subset)
+        if (AOT_KERNELS or NUMBA_AVAILABLE) and n <= MAX_MASK_BITS:
+            mask = int(_bf_kernel(n, self._edge_masks()))
+            return self._to_labels(i for i in range(n) if (mask >> i) & 1)
+
+        edge_list = list(zip(self._src.tolist(), self._dst.tolist()))
+        for k in range(n + 1):
+            for subset in combinations(range(n), k):
+                candidate = frozenset(subset)
                 if self._covers_all_edges(candidate, edge_list):
-                    return candidate
+                    return self._to_labels(candidate)
         return set()
 
+    def branch_and_bound_vertex_cover(self, max_n: int = MAX_MASK_BITS) -> Optional[Set[str]]:
+        """Exact minimum vertex cover by branch-and-reduce with lower-bound pruning.
+
+        Returns None when the instance exceeds max_n (capped at MAX_MASK_BITS).
+        Worst case remains exponential, but reductions and pruning keep the search
+        tree small on sparse PPI-like graphs.
+        """
+
+        n = len(self._labels)
+        if n > min(max_n, MAX_MASK_BITS):
+            return None
+        mask = int(_bnb_kernel(n, self._neighbor_masks()))
+        return self._to_labels(i for i in range(n) if (mask >> i) & 1)
+
+    def _neighbor_masks(self) -> np.ndarray:
+        """Encode the neighbors of each vertex as an int64 bitmask."""
+
+        one = np.int64(1)
+        masks = np.zeros(len(self._labels), dtype=np.int64)
+        np.bitwise_or.at(masks, self._src, one << self._dst.astype(np.int64))
+        np.bitwise_or.at(masks, self._dst, one << self._src.astype(np.int64))
+        return masks
+
+    def _edge_masks(self) -> np.ndarray:
+        """Encode each edge (u, v) as the int64 bitmask (1 << u) | (1 << v)."""
+
+        one = np.int64(1)
+        return (one << self._src.astype(np.int64)) | (one << self._dst.astype(np.int64))
+
+    def _to_ids(self, cover: Iterable[str]) -> Set[int]:
+        """Map protein labels to vertex ids, ignoring labels not in the network."""
+
+        ids = self._ids
+        return {ids[p] for p in cover if p in ids}
+
+    def _to_labels(self, ids: Iterable[int]) -> Set[str]:
+        """Map vertex ids back to protein labels at the public API boundary."""
+
+        labels = self._labels
+        return {labels[i] for i in ids}
+
     @staticmethod
-    def _covers_all_edges(cover: Set[str], edges: List[Tuple[str, str]]) -> bool:
-        return all(u in cover or v in cover for u, v in edges)
+    def _covers_all_edges(cover: FrozenSet[int], edges: List[Tuple[int, int]]) -> bool:
+        for u, v in edges:
+            if u not in cover and v not in cover:
+                return False
+        return True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+"""Test suite for protein interaction network vertex cover."""
+
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# Add repository root to path
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from NPComplete.protein_network import ProteinInteractionNetwork, _bf_min_cover, _bnb_min_cover
+
+
+def random_network(n: int, p: float, rng: random.Random) -> ProteinInteractionNetwork:
+    """G(n, p) graph with proteins P0..P{n-1}."""
+    proteins = [f"P{i}" for i in range(n)]
+    edges = [(proteins[u], proteins[v]) for u in range(n) for v in range(u + 1, n) if rng.random() < p]
+    return ProteinInteractionNetwork(proteins, edges)
+
+
+class TestBranchAndBoundVertexCover(unittest.TestCase):
+    """Test the branch-and-reduce solver against brute-force enumeration."""
+
+    def test_matches_brute_force_on_random_graphs(self):
+        """Test that branch-and-bound finds a valid cover of brute-force minimum size."""
+        rng = random.Random(2024)
+        for trial in range(120):
+            n = rng.randint(1, 12)
+            ppi = random_network(n, rng.choice([0.1, 0.3, 0.5, 0.8]), rng)
+            optimal_size = bin(int(_bf_min_cover(n, ppi._edge_masks()))).count("1")
+
+            cover = ppi.branch_and_bound_vertex_cover()
+            self.assertTrue(ppi.is_vertex_cover(cover), f"trial {trial}: not a cover")
+            self.assertEqual(len(cover), optimal_size, f"trial {trial}: n={n}, m={ppi.stats()['m']}")
+
+            mask = int(_bnb_min_cover(n, ppi._neighbor_masks()))
+            self.assertEqual(bin(mask).count("1"), optimal_size)
+            self.assertTrue(ppi.is_vertex_cover(ppi._to_labels(i for i in range(n) if (mask >> i) & 1)))
+
+    def test_python_kernel_matches_brute_force(self):
+        """Test the uncompiled kernel too, which runs when numba is not installed."""
+        bnb = getattr(_bnb_min_cover, "py_func", _bnb_min_cover)
+        bf = getattr(_bf_min_cover, "py_func", _bf_min_cover)
+        rng = random.Random(7)
+        for _ in range(30):
+            n = rng.randint(1, 9)
+            ppi = random_network(n, 0.4, rng)
+            self.assertEqual(
+                bin(int(bnb(n, ppi._neighbor_masks()))).count("1"),
+                bin(int(bf(n, ppi._edge_masks()))).count("1"),
+            )
+
+    def test_edge_cases(self):
+        """Test empty, edgeless, clique and Barabási–Albert graphs."""
+        self.assertEqual(ProteinInteractionNetwork([], []).branch_and_bound_vertex_cover(), set())
+        self.assertEqual(ProteinInteractionNetwork(["A", "B"], []).branch_and_bound_vertex_cover(), set())
+
+        clique = ProteinInteractionNetwork(list("ABCDE"), [(u, v) for u in "ABCDE" for v in "ABCDE" if u < v])
+        self.assertEqual(len(clique.branch_and_bound_vertex_cover()), 4)
+
+        ppi = ProteinInteractionNetwork.from_barabasi_albert(n=16, m=3, seed=12345)
+        cover = ppi.branch_and_bound_vertex_cover()
+        self.assertTrue(ppi.is_vertex_cover(cover))
+        self.assertEqual(len(cover), len(ppi.brute_force_optimal_vertex_cover()))
+        self.assertIsNone(ppi.branch_and_bound_vertex_cover(max_n=15))
+
+
+if __name__ == "__main__":
+    unittest.main()
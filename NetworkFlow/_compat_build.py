@@ -0,0 +1,37 @@
+"""Compile the optional C compatibility count in src/_netflow_compat.c.
+
+Run ``python NetworkFlow/_compat_build.py`` once to produce the
+``_netflow_compat`` extension module next to this file. validation.py picks it
+up for count_compatible_pairs and analyze_network_structure and otherwise
+falls back to the numba/NumPy scans, so the build is never required.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sysconfig
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+SOURCE = HERE / "src" / "_netflow_compat.c"
+
+
+def build(output_dir: Path = HERE) -> Path:
+    """Compile the extension into output_dir and return its path."""
+    compiler = shutil.which((sysconfig.get_config_var("CC") or "cc").split()[0]) or shutil.which("cc")
+    if compiler is None:
+        raise RuntimeError("no C compiler found")
+    target = Path(output_dir) / ("_netflow_compat" + sysconfig.get_config_var("EXT_SUFFIX"))
+    result = subprocess.run(
+        [compiler, "-O3", "-shared", "-fPIC", "-I", sysconfig.get_paths()["include"],
+         str(SOURCE), "-o", str(target)],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError("could not build _netflow_compat: " + result.stderr.decode(errors="replace"))
+    return target
+
+
+if __name__ == "__main__":
+    print(f"WROTE: {build()}")
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import argparse
 import csv
+import gc
 import math
 import platform
 import statistics
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 # Handle imports whether run as script or module
 if __name__ == "__main__" and __package__ is None:
@@ -34,12 +37,18 @@ def _ensure_dirs() -> tuple[Path, Path]:
 
 
 def _median_time(func, *args, repeats: int = 5) -> float:
-    """Measure median execution time over multiple runs."""
+    """Measure median execution time over multiple runs, with GC paused."""
     samples = []
-    for _ in range(repeats):
-        start = time.perf_counter()
-        func(*args)
-        samples.append(time.perf_counter() - start)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func(*args)
+            samples.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
     return statistics.median(samples)
 
 
@@ -47,21 +56,21 @@ def _write_csv(
     path: Path, headers: Iterable[str], rows: Iterable[Iterable[object]]
 ) -> None:
     """Write CSV file with headers and rows."""
-    with path.open("w", newline="", encoding="utf-8") as handle:
+    with path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
         writer = csv.writer(handle)
         writer.writerow(headers)
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
 
 
-def _save_environment_report(results_dir: Path) -> None:
-    """Save execution environment information."""
+def _save_environment_report(results_dir: Path, workers: Optional[int] = 1) -> None:
+    """Save execution environment information, including the runtime sweep's worker count."""
     from datetime import timezone
     
     info = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "python": platform.python_version(),
         "platform": platform.platform(),
+        "workers": workers or "cpu_count",
     }
     path = results_dir / "environment.txt"
     with path.open("w", encoding="utf-8") as handle:
@@ -81,55 +90,90 @@ def _build_reference_curve(
     return [coeff * transform(x) for x in xs]
 
 
-def run_runtime_benchmarks(figures: Path, results: Path) -> None:
-    """Measure runtime scaling and validate O(VE^2) complexity."""
+def _measure_size(n: int, seed: int, repeats: int) -> Tuple[int, float, float, int, int]:
+    """Benchmark one network size; returns (n, t_build, t_solve, max_flow, phases)."""
+    donors, recipients = generate_transplant_case(n, n, seed=seed)
+    
+    # The untimed first solve also warms up the JIT-compiled kernels
+    solver = OrganTransplantNetworkFlow(donors, recipients)
+    max_flow, matches, phases = solver.dinic()
+    
+    # Construction (compatibility scan) and max-flow are timed separately
+    t_build = _median_time(OrganTransplantNetworkFlow, donors, recipients, repeats=repeats)
+    t_solve = _median_time(solver.dinic, repeats=repeats)
+    return n, t_build, t_solve, max_flow, phases
+
+
+def run_runtime_benchmarks(
+    figures: Path,
+    results: Path,
+    no_plots: bool = False,
+    workers: Optional[int] = 1,
+) -> None:
+    """
+    Measure runtime scaling of Dinic's algorithm against an O(E sqrt(V)) curve.
+    
+    Sizes are timed in-process one after another by default. They are
+    independent, so workers > 1 (or None for os.cpu_count()) measures them in
+    a process pool instead, at the cost of cross-process contention in the
+    recorded times.
+    """
     sizes = [5, 10, 15, 20, 25, 30, 35, 40]
     repeats = 5
     
+    jobs = [(n, idx, repeats) for idx, n in enumerate(sizes)]
+    if workers == 1:
+        measured = [_measure_size(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            measured = list(executor.map(_measure_size, *zip(*jobs)))
+    measured.sort(key=lambda row: row[0])
+    
     records = []
     transplants = []
     iterations = []
     
-    for idx, n in enumerate(sizes):
-        donors, recipients = generate_transplant_case(n, n, seed=idx)
-        
-        solver = OrganTransplantNetworkFlow(donors, recipients)
-        
-        start = time.perf_counter()
-        max_flow, matches, iters = solver.ford_fulkerson_edmonds_karp()
-        elapsed = time.perf_counter() - start
-        
-        records.append((n, elapsed))
+    for n, t_build, t_solve, max_flow, phases in measured:
+        records.append((n, t_build, t_solve, t_build + t_solve))
         transplants.append(max_flow)
-        iterations.append(iters)
+        iterations.append(phases)
         
-        print(f"n={n:2d}: time={elapsed:.4f}s, transplants={max_flow:2d}, iterations={iters:3d}")
+        print(
+            f"n={n:2d}: build={t_build:.4f}s, solve={t_solve:.4f}s, "
+            f"transplants={max_flow:2d}, phases={phases:3d}"
+        )
     
-    _write_csv(results / "times.csv", ("n", "seconds"), records)
+    _write_csv(results / "times.csv", ("n", "build_s", "solve_s", "total_s"), records)
     _write_csv(results / "transplants.csv", ("n", "successful"), zip(sizes, transplants))
     _write_csv(results / "iterations.csv", ("n", "iterations"), zip(sizes, iterations))
     
-    # Build O(VE^2) reference curve
+    build_times = [t_build for _, t_build, _, _ in records]
+    solve_times = [t_solve for _, _, t_solve, _ in records]
+    
+    # Build O(E sqrt(V)) reference curve (Dinic's bound on this network up to
+    # the donor-capacity factor), anchored on the max-flow (solve) time
     if records:
         def complexity(n):
             V = 2 * n + 2
             E = n + n * n + n
-            return V * E * E
+            return E * math.sqrt(V)
         
-        reference = _build_reference_curve(records[0], sizes, complexity)
+        reference = _build_reference_curve((sizes[0], solve_times[0]), sizes, complexity)
     else:
         reference = [0.0 for _ in sizes]
     
+    if no_plots:
+        return
+    
     # Plot runtime
     _plot_runtime(
         sizes,
-        [t for _, t in records],
-        reference,
+        [("build", build_times), ("solve", solve_times)],
+        ("c · E√V", reference),
         figures / "runtime_vs_n.png",
         figures / "runtime_vs_n.pdf",
         title="Organ Transplant Network Flow: Runtime vs Size",
         ylabel="seconds",
-        legend=("measured", "c · VE²"),
     )
     
     # Plot successful transplants
@@ -146,18 +190,18 @@ def run_runtime_benchmarks(figures: Path, results: Path) -> None:
 
 def _plot_runtime(
     xs: List[int],
-    ys: List[float],
-    reference: List[float],
+    series: Sequence[Tuple[str, List[float]]],
+    reference: Tuple[str, List[float]],
     png_path: Path,
     pdf_path: Path,
     title: str,
     ylabel: str,
-    legend: Tuple[str, str],
 ) -> None:
-    """Plot runtime with theoretical reference curve."""
+    """Plot one or more measured runtime series with a theoretical reference curve."""
     plt.figure(figsize=(6, 4))
-    plt.plot(xs, ys, marker="o", label=legend[0])
-    plt.plot(xs, reference, linestyle="--", label=legend[1])
+    for label, ys in series:
+        plt.plot(xs, ys, marker="o", label=label)
+    plt.plot(xs, reference[1], linestyle="--", label=reference[0])
     plt.xlabel("network size (n donors, n recipients)")
     plt.ylabel(ylabel)
     plt.title(title)
@@ -181,7 +225,7 @@ def run_compatibility_analysis(figures: Path, results: Path) -> None:
     for idx, pattern_name in enumerate(patterns):
         donors, recipients = generate_transplant_case(n, n, seed=40 + idx)
         solver = OrganTransplantNetworkFlow(donors, recipients)
-        max_flow, matches, _ = solver.ford_fulkerson_edmonds_karp()
+        max_flow, matches, _ = solver.dinic()
         
         success_rate = max_flow / n if n > 0 else 0
         rows.append((pattern_name, n, max_flow, f"{success_rate:.2%}"))
@@ -193,10 +237,25 @@ def run_compatibility_analysis(figures: Path, results: Path) -> None:
 
 def main() -> None:
     """Run all benchmarks and generate outputs."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-plots",
+        action="store_true",
+        help="write CSV results only and skip figure generation",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes for the runtime sweep (default: 1, timed in-process; 0 = CPU count, noisier timings)",
+    )
+    args = parser.parse_args()
+    workers = args.workers or None
+    
     figures, results = _ensure_dirs()
-    run_runtime_benchmarks(figures, results)
+    run_runtime_benchmarks(figures, results, no_plots=args.no_plots, workers=workers)
     run_compatibility_analysis(figures, results)
-    _save_environment_report(results)
+    _save_environment_report(results, workers)
     print("Benchmarks complete. Results saved to 'results/' and 'figures/' directories.")
 
 
@@ -63,7 +63,7 @@ def main() -> None:
             "\\begin{figure}[ht]",
             "\\centering",
             "\\includegraphics[width=\\linewidth]{NetworkFlow/figures/runtime_vs_n.pdf}",
-            "\\caption{Measured runtime for organ transplant network flow with reference $O(VE^2)$ curve.}",
+            "\\caption{Measured runtime for organ transplant network flow with reference $O(E\\sqrt{V})$ curve (Dinic).}",
             "\\label{fig:nf-runtime}",
             "\\end{figure}",
             "",
@@ -84,15 +84,17 @@ def main() -> None:
         "",
         "\\begin{table}[H]",
         "  \\centering",
-        "  \\caption{Network flow runtime (expected O(VE²))}",
+        "  \\caption{Network flow runtime (Dinic, expected O(E$\\sqrt{V}$))}",
         "  \\label{tab:nf-runtime}",
         "  \\pgfplotstabletypeset[",
         "    col sep=comma,",
         "    header=true,",
         "    string type,",
-        "    columns={n,seconds},",
+        "    columns={n,build_s,solve_s,total_s},",
         "    columns/n/.style={column name={$n$}},",
-        "    columns/seconds/.style={column name={seconds}}",
+        "    columns/build_s/.style={column name={build (s)}},",
+        "    columns/solve_s/.style={column name={solve (s)}},",
+        "    columns/total_s/.style={column name={total (s)}}",
         "  ]{NetworkFlow/results/times.csv}",
         "\\end{table}",
         "",
@@ -112,7 +114,7 @@ def main() -> None:
         "",
         "\\begin{table}[H]",
         "  \\centering",
-        "  \\caption{Algorithm iterations (augmenting paths)}",
+        "  \\caption{Algorithm iterations (Dinic phases)}",
         "  \\label{tab:nf-iterations}",
         "  \\pgfplotstabletypeset[",
         "    col sep=comma,",
@@ -2,10 +2,103 @@
 
 from __future__ import annotations
 
-from collections import deque, defaultdict
-from typing import List, Tuple, Set
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Set, Union
 import random
 
+import numpy as np
+
+try:
+    from ._core import NUMBA_AVAILABLE, _dinic, _hopcroft_karp, _max_flow
+except ImportError:  # imported as a top-level module from the NetworkFlow directory
+    from _core import NUMBA_AVAILABLE, _dinic, _hopcroft_karp, _max_flow
+
+# Distinct blood types / tissue markers per network must fit in a uint64 bitmask
+# for the vectorized compatibility check; larger alphabets (more blood labels, or
+# wider int tissue masks) use the scalar path. Named tissue markers are capped here.
+MAX_MASK_BITS = 64
+
+# ABO blood types. BLOOD_COMPAT[d, m] says whether a donor of type index d can
+# give to a recipient whose accepted types form bitmask m over these indices.
+BLOOD_TYPES = ('O', 'A', 'B', 'AB')
+BLOOD_IDX = {blood: idx for idx, blood in enumerate(BLOOD_TYPES)}
+BLOOD_COMPAT = (
+    (np.arange(1 << len(BLOOD_TYPES)) >> np.arange(len(BLOOD_TYPES))[:, None]) & 1
+).astype(bool)
+
+# Bit index of each blood type label (BLOOD_TYPES first, so O/A/B/AB are bits
+# 0-3); labels outside BLOOD_TYPES get the next free bit the first time they
+# are seen. Shared by the solver and the validators through blood_bit.
+_BLOOD_BITS = dict(BLOOD_IDX)
+
+# Tissue markers are stored as int bitmasks: HLA-k is bit k. This registry is
+# fixed; other marker names only get bits in a per-case marker_registry().
+HLA_MARKERS = tuple(f"HLA-{i}" for i in range(10))
+_MARKER_BITS = {marker: bit for bit, marker in enumerate(HLA_MARKERS)}
+
+TissueMarkers = Union[int, Set[str]]
+
+
+def marker_registry() -> Dict[str, int]:
+    """Fresh marker name -> bit registry for one case, pre-seeded with HLA_MARKERS."""
+    return dict(_MARKER_BITS)
+
+
+def tissue_mask(markers: int | Iterable[str], registry: Dict[str, int] | None = None) -> int:
+    """
+    Encode a set of tissue marker names as an int bitmask.
+    
+    Ints are treated as already-encoded masks and returned unchanged, so both
+    representations are accepted wherever tissue markers are expected.
+    
+    Without a registry only HLA_MARKERS are known and any other name raises
+    ValueError. A registry from marker_registry() gives further names the next
+    free bit, so masks are comparable only when built with the same registry;
+    it holds at most MAX_MASK_BITS names.
+    """
+    if isinstance(markers, int):
+        return markers
+    bits = _MARKER_BITS if registry is None else registry
+    mask = 0
+    for marker in markers:
+        try:
+            bit = bits[marker]
+        except KeyError:
+            if registry is None:
+                raise ValueError(
+                    f"Unknown tissue marker {marker!r}; encode non-HLA names with a marker_registry()"
+                ) from None
+            if len(registry) >= MAX_MASK_BITS:
+                raise ValueError(f"More than {MAX_MASK_BITS} distinct tissue markers in one case") from None
+            bit = registry[marker] = len(registry)
+        mask |= 1 << bit
+    return mask
+
+
+def blood_bit(blood: str) -> int:
+    """Single-bit mask of one blood type label."""
+    return 1 << _BLOOD_BITS.setdefault(blood, len(_BLOOD_BITS))
+
+
+@lru_cache(maxsize=256)
+def blood_compat_mask(blood_compat: Tuple[str, ...]) -> int:
+    """OR of blood_bit over a recipient's accepted types, memoized per tuple."""
+    mask = 0
+    for blood in blood_compat:
+        mask |= blood_bit(blood)
+    return mask
+
+
+if hasattr(np, "bitwise_count"):
+    popcount = np.bitwise_count
+else:  # pragma: no cover - NumPy < 2.0
+    _POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(x: np.ndarray) -> np.ndarray:
+        """Per-element popcount of a uint64 array via a byte lookup table."""
+        x = np.ascontiguousarray(x, dtype=np.uint64)
+        return _POPCOUNT_TABLE[x.view(np.uint8)].reshape(*x.shape, 8).sum(axis=-1)
+
 
 class OrganTransplantNetworkFlow:
     """
@@ -17,8 +110,8 @@ class OrganTransplantNetworkFlow:
     
     def __init__(
         self,
-        donors: List[Tuple[int, str, Set[str]]],
-        recipients: List[Tuple[List[str], Set[str], int]]
+        donors: List[Tuple[int, str, TissueMarkers]],
+        recipients: List[Tuple[List[str], TissueMarkers, int]]
     ):
         """
         Initialize transplant network.
@@ -26,9 +119,17 @@ class OrganTransplantNetworkFlow:
         Args:
             donors: List of (num_organs, blood_type, tissue_markers)
             recipients: List of (compatible_blood_types, tissue_markers, urgency)
+        
+        Tissue markers may be int bitmasks or sets of marker names; they are
+        stored as bitmasks (see tissue_mask), with one marker registry per case.
         """
-        self.donors = donors
-        self.recipients = recipients
+        markers = marker_registry()
+        self.donors = [
+            (num_organs, blood, tissue_mask(tissue, markers)) for num_organs, blood, tissue in donors
+        ]
+        self.recipients = [
+            (compat, tissue_mask(tissue, markers), urgency) for compat, tissue, urgency in recipients
+        ]
         self.n_donors = len(donors)
         self.n_recipients = len(recipients)
         
@@ -38,16 +139,18 @@ class OrganTransplantNetworkFlow:
         self.sink = self.n_donors + self.n_recipients + 1
         self.total_nodes = self.n_donors + self.n_recipients + 2
         
+        # Capacity of the source and sink cuts; no flow can exceed either
+        self._flow_upper_bound = min(sum(d[0] for d in donors), self.n_recipients)
+        
         # Build flow network
-        self.graph = defaultdict(dict)
         self._build_network()
     
     def _check_compatibility(
         self,
         donor_blood: str,
-        donor_tissue: Set[str],
+        donor_tissue: TissueMarkers,
         recip_blood_compat: List[str],
-        recip_tissue: Set[str]
+        recip_tissue: TissueMarkers
     ) -> bool:
         """
         Check medical compatibility between donor and recipient.
@@ -60,121 +163,341 @@ class OrganTransplantNetworkFlow:
         
         Tissue compatibility: at least 50% marker match required
         """
-        # Blood type check
-        blood_compatible = donor_blood in recip_blood_compat
+        # Blood type check, as an AND of bitmasks
+        blood_compatible = (blood_bit(donor_blood) & blood_compat_mask(tuple(recip_blood_compat))) != 0
         
         # Tissue marker check
-        if len(donor_tissue) == 0 or len(recip_tissue) == 0:
+        markers = marker_registry()
+        donor_tissue = tissue_mask(donor_tissue, markers)
+        recip_tissue = tissue_mask(recip_tissue, markers)
+        if donor_tissue == 0 or recip_tissue == 0:
             tissue_compatible = True
         else:
-            match_count = len(donor_tissue & recip_tissue)
-            tissue_compatible = match_count >= len(recip_tissue) * 0.5
+            match_count = (donor_tissue & recip_tissue).bit_count()
+            tissue_compatible = match_count * 2 >= recip_tissue.bit_count()
         
         return blood_compatible and tissue_compatible
     
+    def _compatibility_matrix(self) -> np.ndarray:
+        """
+        Evaluate _check_compatibility for every donor-recipient pair at once.
+        
+        Blood types are encoded with blood_bit / blood_compat_mask, so for
+        standard ABO types (bits 0-3) blood compatibility is one BLOOD_COMPAT
+        gather (other labels have further bits and are tested with AND). With
+        tissue bitmasks the 50% rule becomes
+        2 * popcount(donor & recipient) >= popcount(recipient).
+        
+        Returns:
+            Boolean array of shape (n_donors, n_recipients)
+        """
+        donor_blood = [blood_bit(blood) for _, blood, _ in self.donors]
+        recip_blood = [blood_compat_mask(tuple(compat)) for compat, _, _ in self.recipients]
+        donor_tissue = [tissue for _, _, tissue in self.donors]
+        recip_tissue = [tissue for _, tissue, _ in self.recipients]
+        blood_bits = max(donor_blood + recip_blood, default=0).bit_length()
+        tissue_bits = max(donor_tissue + recip_tissue, default=0).bit_length()
+        
+        if max(blood_bits, tissue_bits) > MAX_MASK_BITS:
+            return self._compatibility_matrix_scalar(donor_blood, recip_blood, donor_tissue, recip_tissue)
+        
+        donor_tissue = np.array(donor_tissue, dtype=np.uint64)
+        recip_tissue = np.array(recip_tissue, dtype=np.uint64)
+        
+        if blood_bits <= len(BLOOD_TYPES):
+            donor_blood = np.array([bit.bit_length() - 1 for bit in donor_blood], dtype=np.intp)
+            recip_blood = np.array(recip_blood, dtype=np.intp)
+            blood_compatible = BLOOD_COMPAT[donor_blood[:, None], recip_blood[None, :]]
+        else:
+            donor_blood = np.array(donor_blood, dtype=np.uint64)
+            recip_blood = np.array(recip_blood, dtype=np.uint64)
+            blood_compatible = (donor_blood[:, None] & recip_blood[None, :]) != 0
+        
+        # match_count * 2 >= len(recip) <=> match_count >= ceil(len(recip) / 2)
+        donor_count = popcount(donor_tissue)
+        recip_count = popcount(recip_tissue)
+        recip_threshold = (recip_count + 1) // 2
+        match_count = popcount(donor_tissue[:, None] & recip_tissue[None, :])
+        tissue_compatible = (
+            (donor_count == 0)[:, None]
+            | (recip_count == 0)[None, :]
+            | (match_count >= recip_threshold[None, :])
+        )
+        
+        return blood_compatible & tissue_compatible
+    
+    def _compatibility_matrix_scalar(
+        self,
+        donor_blood: List[int],
+        recip_blood: List[int],
+        donor_tissue: List[int],
+        recip_tissue: List[int]
+    ) -> np.ndarray:
+        """
+        _check_compatibility for every pair, for alphabets too large for uint64 masks.
+        
+        Takes the donor blood bits, accepted-type masks and tissue masks built by
+        _compatibility_matrix as Python ints. Each recipient's blood mask, tissue
+        mask and 50% threshold are fixed before the donor loop, which then does
+        only the ANDs and one bit_count per pair.
+        """
+        # match_count * 2 >= len(recip) <=> match_count >= ceil(len(recip) / 2)
+        recip_info = [
+            (blood, tissue, (tissue.bit_count() + 1) // 2)
+            for blood, tissue in zip(recip_blood, recip_tissue)
+        ]
+        compatible = np.zeros((self.n_donors, self.n_recipients), dtype=bool)
+        for i, (d_bit, d_tissue) in enumerate(zip(donor_blood, donor_tissue)):
+            compatible[i] = [
+                bool(d_bit & r_blood) and (not d_tissue or (d_tissue & r_tissue).bit_count() >= threshold)
+                for r_blood, r_tissue, threshold in recip_info
+            ]
+        return compatible
+    
     def _build_network(self) -> None:
         """Construct flow network from transplant matching problem."""
-        # Source to donors (capacity = available organs)
-        for i, (num_organs, blood_type, tissue) in enumerate(self.donors):
-            donor_node = i + 1
-            self.graph[self.source][donor_node] = num_organs
-        
-        # Donors to recipients (if compatible)
-        for i, (num_organs, d_blood, d_tissue) in enumerate(self.donors):
-            donor_node = i + 1
-            for j, (r_blood_compat, r_tissue, urgency) in enumerate(self.recipients):
-                recipient_node = self.n_donors + j + 1
-                if self._check_compatibility(d_blood, d_tissue, r_blood_compat, r_tissue):
-                    self.graph[donor_node][recipient_node] = 1  # One organ per match
-        
-        # Recipients to sink (capacity = 1, each needs one organ)
-        for j, (r_blood, r_tissue, urgency) in enumerate(self.recipients):
-            recipient_node = self.n_donors + j + 1
-            self.graph[recipient_node][self.sink] = 1
-    
-    def bfs(self, residual_graph: dict, parent: dict) -> bool:
+        compatible_pairs = np.argwhere(self._compatibility_matrix())
+        n_pairs = len(compatible_pairs)
+        donor_nodes = np.arange(1, self.n_donors + 1)
+        recipient_nodes = np.arange(self.n_donors + 1, self.n_donors + self.n_recipients + 1)
+        
+        # Edges in order: source -> donors (capacity = available organs), donors ->
+        # compatible recipients (one organ per match), recipients -> sink (each
+        # needs one organ)
+        tails = np.concatenate([
+            np.full(self.n_donors, self.source), compatible_pairs[:, 0] + 1, recipient_nodes
+        ])
+        heads = np.concatenate([
+            donor_nodes, compatible_pairs[:, 1] + self.n_donors + 1,
+            np.full(self.n_recipients, self.sink),
+        ])
+        capacities = np.concatenate([
+            np.array([num_organs for num_organs, _, _ in self.donors], dtype=np.int64),
+            np.ones(n_pairs + self.n_recipients, dtype=np.int64),
+        ])
+        self._build_residual(tails, heads, capacities)
+        
+        # Forward edge index of each compatible pair, ordered by (donor, recipient)
+        self._match_edges = 2 * (self.n_donors + np.arange(n_pairs))
+        self._match_pairs = compatible_pairs
+    
+    def _build_residual(self, tails: np.ndarray, heads: np.ndarray, capacities: np.ndarray) -> None:
+        """
+        Lay out the flow network as forward-star (CSR-style) NumPy arrays.
+        
+        Each edge index e stores its head node (``_edges_head[e]``), the next edge
+        leaving the same tail (``_edges_next[e]``) and its capacity
+        (``_edges_cap_initial[e]``); ``_node_head[u]`` is the first edge leaving
+        u, with -1 terminating each list. Logical edge k sits at index 2k and its
+        zero-capacity reverse twin at 2k + 1 (= 2k ^ 1), so a solve seeds its
+        residual capacities with a single copy of ``_edges_cap_initial``.
+        """
+        n_edges = 2 * len(tails)
+        edge_tails = np.empty(n_edges, dtype=np.int32)
+        edge_tails[0::2] = tails
+        edge_tails[1::2] = heads
+        self._edges_head = np.empty(n_edges, dtype=np.int32)
+        self._edges_head[0::2] = heads
+        self._edges_head[1::2] = tails
+        self._edges_cap_initial = np.zeros(n_edges, dtype=np.int32)
+        self._edges_cap_initial[0::2] = capacities
+        
+        # Each adjacency list runs from the newest edge to the oldest, as if the
+        # edges had been pushed onto the front one at a time.
+        order = np.argsort(edge_tails, kind="stable")
+        sorted_tails = edge_tails[order]
+        same_tail = np.zeros(n_edges, dtype=bool)
+        same_tail[1:] = sorted_tails[1:] == sorted_tails[:-1]
+        self._edges_next = np.full(n_edges, -1, dtype=np.int32)
+        self._edges_next[order[same_tail]] = order[np.flatnonzero(same_tail) - 1]
+        self._node_head = np.full(self.total_nodes, -1, dtype=np.int32)
+        self._node_head[sorted_tails] = order  # last write per tail is its newest edge
+        self._csr_lists = None
+    
+    def _csr_as_lists(self) -> Tuple[List[int], List[int], List[int]]:
+        """
+        (node_head, edges_next, edges_head) as lists for the pure-Python path.
+        
+        Indexing lists from the interpreter avoids boxing a NumPy scalar per access.
+        """
+        if self._csr_lists is None:
+            self._csr_lists = (
+                self._node_head.tolist(), self._edges_next.tolist(), self._edges_head.tolist()
+            )
+        return self._csr_lists
+    
+    def bfs(
+        self,
+        residual_cap: List[int],
+        parent_edge: List[int],
+        visited: bytearray,
+        queue: List[int],
+    ) -> bool:
         """
         Breadth-First Search to find augmenting path.
         
+        Args:
+            residual_cap: Residual capacity per edge index
+            parent_edge: Filled with the edge used to reach each node
+            visited: Scratch flags, one byte per node (cleared on entry)
+            queue: Scratch FIFO with room for every node
+        
         Returns:
             True if path exists from source to sink
         """
-        visited = set([self.source])
-        queue = deque([self.source])
+        node_head, edges_next, edges_head = self._csr_as_lists()
+        sink = self.sink
+        visited[:] = bytes(self.total_nodes)
+        visited[self.source] = 1
+        queue[0] = self.source
+        qh, qt = 0, 1
         
-        while queue:
-            u = queue.popleft()
+        while qh < qt:
+            u = queue[qh]
+            qh += 1
             
-            for v in residual_graph.get(u, {}):
-                if v not in visited and residual_graph[u][v] > 0:
-                    visited.add(v)
-                    parent[v] = u
-                    if v == self.sink:
+            e = node_head[u]
+            while e != -1:
+                v = edges_head[e]
+                if not visited[v] and residual_cap[e] > 0:
+                    visited[v] = 1
+                    parent_edge[v] = e
+                    if v == sink:
                         return True
-                    queue.append(v)
+                    queue[qt] = v
+                    qt += 1
+                e = edges_next[e]
         
         return False
     
-    def ford_fulkerson_edmonds_karp(self) -> Tuple[int, List[Tuple[int, int]], int]:
+    def _augment(self, residual: np.ndarray) -> Tuple[int, int]:
         """
-        Ford-Fulkerson algorithm using Edmonds-Karp (BFS for paths).
-        
-        Time Complexity: O(VE^2) where V = nodes, E = edges
+        Pure-Python Edmonds-Karp loop, updating ``residual`` in place.
         
         Returns:
-            (max_flow_value, matching_list, iterations)
+            (max_flow, iterations)
         """
-        # Create residual graph
-        residual = defaultdict(dict)
-        for u in self.graph:
-            for v in self.graph[u]:
-                residual[u][v] = self.graph[u][v]
-                if v not in residual:
-                    residual[v] = {}
-                if u not in residual[v]:
-                    residual[v][u] = 0
-        
-        parent = {}
+        edges_head = self._csr_as_lists()[2]
+        cap = residual.tolist()
+        parent_edge = [-1] * self.total_nodes
+        visited = bytearray(self.total_nodes)
+        queue = [0] * self.total_nodes
         max_flow = 0
         iterations = 0
         
         # Find augmenting paths
-        while self.bfs(residual, parent):
+        while self.bfs(cap, parent_edge, visited, queue):
             iterations += 1
             
-            # Find bottleneck capacity
-            path_flow = float('inf')
-            v = self.sink
-            while v != self.source:
-                u = parent[v]
-                path_flow = min(path_flow, residual[u][v])
-                v = u
+            # Find bottleneck capacity (the tail of edge e is the head of e ^ 1).
+            # Residuals are positive ints, so a unit edge into the sink (every
+            # recipient -> sink edge) already fixes the bottleneck at 1.
+            path_flow = cap[parent_edge[self.sink]]
+            if path_flow > 1:
+                v = self.sink
+                while v != self.source:
+                    e = parent_edge[v]
+                    path_flow = min(path_flow, cap[e])
+                    v = edges_head[e ^ 1]
             
             # Update residual capacities
             v = self.sink
             while v != self.source:
-                u = parent[v]
-                residual[u][v] -= path_flow
-                residual[v][u] += path_flow
-                v = u
+                e = parent_edge[v]
+                cap[e] -= path_flow
+                cap[e ^ 1] += path_flow
+                v = edges_head[e ^ 1]
             
             max_flow += path_flow
-            parent = {}
+            if max_flow >= self._flow_upper_bound:
+                break
         
-        # Extract matching
-        matches = []
-        for i in range(self.n_donors):
-            donor_node = i + 1
-            for j in range(self.n_recipients):
-                recipient_node = self.n_donors + j + 1
-                if recipient_node in self.graph.get(donor_node, {}):
-                    original_cap = self.graph[donor_node][recipient_node]
-                    residual_cap = residual.get(donor_node, {}).get(recipient_node, 0)
-                    flow = original_cap - residual_cap
-                    if flow > 0:
-                        matches.append((i, j))
+        residual[:] = cap
+        return max_flow, iterations
+    
+    def ford_fulkerson_edmonds_karp(self) -> Tuple[int, List[Tuple[int, int]], int]:
+        """
+        Ford-Fulkerson algorithm using Edmonds-Karp (BFS for paths).
+        
+        Time Complexity: O(VE^2) where V = nodes, E = edges
+        
+        Returns:
+            (max_flow_value, matching_list, iterations)
+        """
+        residual = self._edges_cap_initial.copy()
+        edges_head = self._edges_head
+        
+        if NUMBA_AVAILABLE:
+            max_flow, iterations = _max_flow(
+                self._node_head, self._edges_next, edges_head, residual,
+                self.source, self.sink, self._flow_upper_bound
+            )
+        else:
+            max_flow, iterations = self._augment(residual)
+        
+        matches = self._extract_matches(residual)
+        
+        return int(max_flow), matches, int(iterations)
+    
+    def dinic(self) -> Tuple[int, List[Tuple[int, int]], int]:
+        """
+        Dinic's algorithm: level-graph BFS plus blocking flow with current arcs.
         
-        return max_flow, matches, iterations
+        Time Complexity: O(V^2 E) in general. Every edge here has capacity 1
+        except source -> donor edges, which carry the donor's organ count k;
+        splitting donors into k unit copies gives O(k^1.5 E sqrt(V)), i.e.
+        O(E sqrt(V)) up to that capacity factor (k <= 2 in generated cases)
+        
+        Returns:
+            (max_flow_value, matching_list, phases)
+        """
+        residual = self._edges_cap_initial.copy()
+        max_flow, phases = _dinic(
+            self._node_head, self._edges_next, self._edges_head, residual,
+            self.source, self.sink, self._flow_upper_bound
+        )
+        return int(max_flow), self._extract_matches(residual), int(phases)
+    
+    def hopcroft_karp(self) -> Tuple[int, List[Tuple[int, int]], int]:
+        """
+        Hopcroft-Karp matching on the network with donors expanded to unit capacity.
+        
+        Every recipient needs one organ, so the flow problem is bipartite
+        matching once a donor with k organs is expanded into k unit donors
+        sharing its compatibility list (no expansion for the common one-organ
+        donor).
+        
+        Time Complexity: O(E' sqrt(V')) on the expanded graph, where E' <= k E
+        and V' <= k V for donors of at most k organs
+        
+        Returns:
+            (max_flow_value, matching_list, phases)
+        """
+        organs = np.array([num_organs for num_organs, _, _ in self.donors], dtype=np.int64)
+        donor_ids, recipient_ids = self._match_pairs[:, 0], self._match_pairs[:, 1]
+        
+        # Compatible pairs are sorted by donor, so each donor owns one segment
+        degree = np.bincount(donor_ids, minlength=self.n_donors)
+        seg_end = np.cumsum(degree)
+        seg_start = seg_end - degree
+        if np.all(organs == 1):
+            owner = np.arange(self.n_donors)
+        else:
+            owner = np.repeat(np.arange(self.n_donors), np.maximum(organs, 0))
+        
+        match_left, size, phases = _hopcroft_karp(
+            seg_start[owner].astype(np.int32), seg_end[owner].astype(np.int32),
+            recipient_ids.astype(np.int32), self.n_recipients, self._flow_upper_bound
+        )
+        matched = np.flatnonzero(match_left >= 0)
+        pairs = np.stack([owner[matched], match_left[matched]], axis=1)
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        return int(size), [tuple(pair) for pair in pairs.tolist()], int(phases)
+    
+    def _extract_matches(self, residual: np.ndarray) -> List[Tuple[int, int]]:
+        """Read (donor, recipient) pairs carrying flow off the donor forward edges."""
+        carrying = residual[self._match_edges] < self._edges_cap_initial[self._match_edges]
+        return [tuple(pair) for pair in self._match_pairs[carrying].tolist()]
 
 
 def generate_transplant_case(
@@ -185,32 +508,62 @@ def generate_transplant_case(
     """
     Generate random transplant case with realistic distributions.
     
+    Seeded cases are memoized, so repeated benchmark runs and tests only sample
+    each case once; every call still returns fresh, independently mutable lists.
+    
     Args:
         n_donors: Number of donors
         n_recipients: Number of recipients
         seed: Random seed for reproducibility
     
     Returns:
-        (donors_list, recipients_list)
+        (donors_list, recipients_list), with tissue markers as int bitmasks
     """
     if n_donors < 0 or n_recipients < 0:
         raise ValueError("Counts must be non-negative")
     
+    if seed is None:
+        donors, recipients = _sample_transplant_case(n_donors, n_recipients, None)
+    else:
+        donors, recipients = _cached_transplant_case(n_donors, n_recipients, seed)
+    
+    return (
+        list(donors),
+        [(list(compat), tissue, urgency) for compat, tissue, urgency in recipients],
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_transplant_case(
+    n_donors: int,
+    n_recipients: int,
+    seed: int
+) -> Tuple[Tuple, Tuple]:
+    """Memoized _sample_transplant_case for seeded (reproducible) cases."""
+    return _sample_transplant_case(n_donors, n_recipients, seed)
+
+
+def _sample_transplant_case(
+    n_donors: int,
+    n_recipients: int,
+    seed: int | None
+) -> Tuple[Tuple, Tuple]:
+    """Draw a case as immutable tuples."""
     prng = random.Random(seed)
     
     # Realistic blood type distributions
-    blood_types = ['O', 'A', 'B', 'AB']
+    blood_types = BLOOD_TYPES
     blood_weights = [0.45, 0.40, 0.11, 0.04]
     
-    # HLA tissue markers
-    all_markers = [f"HLA-{i}" for i in range(10)]
+    # HLA tissue markers (HLA-k is bit k of the mask)
+    n_markers = len(HLA_MARKERS)
     
     # Generate donors
     donors = []
     for _ in range(n_donors):
         num_organs = prng.choices([1, 2], weights=[0.8, 0.2])[0]
         blood = prng.choices(blood_types, weights=blood_weights)[0]
-        tissue = set(prng.sample(all_markers, prng.randint(3, 6)))
+        tissue = _sample_mask(prng, n_markers, prng.randint(3, 6))
         donors.append((num_organs, blood, tissue))
     
     # Generate recipients
@@ -220,22 +573,39 @@ def generate_transplant_case(
         
         # Determine compatible blood types
         if recipient_blood == 'O':
-            blood_compatible = ['O']
+            blood_compatible = ('O',)
         elif recipient_blood == 'A':
-            blood_compatible = ['O', 'A']
+            blood_compatible = ('O', 'A')
         elif recipient_blood == 'B':
-            blood_compatible = ['O', 'B']
+            blood_compatible = ('O', 'B')
         else:  # AB
             blood_compatible = blood_types
         
-        tissue = set(prng.sample(all_markers, prng.randint(3, 5)))
+        tissue = _sample_mask(prng, n_markers, prng.randint(3, 5))
         urgency = prng.randint(1, 10)
         recipients.append((blood_compatible, tissue, urgency))
     
-    return donors, recipients
+    return tuple(donors), tuple(recipients)
+
+
+def _sample_mask(prng: random.Random, n_markers: int, k: int) -> int:
+    """Bitmask of k distinct markers drawn from the first n_markers."""
+    mask = 0
+    for bit in prng.sample(range(n_markers), k):
+        mask |= 1 << bit
+    return mask
 
 
 __all__ = [
+    "BLOOD_COMPAT",
+    "BLOOD_IDX",
+    "BLOOD_TYPES",
+    "HLA_MARKERS",
     "OrganTransplantNetworkFlow",
+    "blood_bit",
+    "blood_compat_mask",
     "generate_transplant_case",
+    "marker_registry",
+    "popcount",
+    "tissue_mask",
 ]
\ No newline at end of file
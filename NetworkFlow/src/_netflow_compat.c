@@ -0,0 +1,91 @@
+/*
+ * Optional C build of the donor x recipient compatibility count.
+ *
+ * Same scan as count_compat in _compat_kernel.py, over the packed arrays from
+ * validation.to_soa: uint64 blood bits, (n, words) uint64 tissue rows and int64
+ * recipient marker counts. validation.py imports it when built and otherwise
+ * uses numba or NumPy. Build it into NetworkFlow/ with
+ *
+ *   python NetworkFlow/_compat_build.py
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+static PyObject *
+count_compat(PyObject *self, PyObject *args)
+{
+    Py_buffer d_blood, d_tissue, r_compat, r_tissue, r_len;
+    Py_ssize_t n_words;
+    if (!PyArg_ParseTuple(args, "y*y*y*y*y*n", &d_blood, &d_tissue, &r_compat,
+                          &r_tissue, &r_len, &n_words)) {
+        return NULL;
+    }
+
+    Py_ssize_t n_donors = d_blood.len / (Py_ssize_t)sizeof(uint64_t);
+    Py_ssize_t n_recipients = r_compat.len / (Py_ssize_t)sizeof(uint64_t);
+    PyObject *result = NULL;
+    if (n_words < 1
+        || d_tissue.len != n_donors * n_words * (Py_ssize_t)sizeof(uint64_t)
+        || r_tissue.len != n_recipients * n_words * (Py_ssize_t)sizeof(uint64_t)
+        || r_len.len != n_recipients * (Py_ssize_t)sizeof(int64_t)) {
+        PyErr_SetString(PyExc_ValueError, "mismatched compatibility buffer sizes");
+        goto done;
+    }
+
+    const uint64_t *db = d_blood.buf, *dt = d_tissue.buf;
+    const uint64_t *rc = r_compat.buf, *rt = r_tissue.buf;
+    const int64_t *rl = r_len.buf;
+    long long total = 0;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < n_donors; i++) {
+        const uint64_t *d_row = dt + i * n_words;
+        for (Py_ssize_t j = 0; j < n_recipients; j++) {
+            if (!(db[i] & rc[j])) {
+                continue;
+            }
+            if (rl[j] > 0) {
+                const uint64_t *r_row = rt + j * n_words;
+                int64_t match_count = 0;
+                for (Py_ssize_t w = 0; w < n_words; w++) {
+                    match_count += __builtin_popcountll(d_row[w] & r_row[w]);
+                }
+                if (2 * match_count < rl[j]) {
+                    continue;
+                }
+            }
+            total++;
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    result = PyLong_FromLongLong(total);
+
+done:
+    PyBuffer_Release(&d_blood);
+    PyBuffer_Release(&d_tissue);
+    PyBuffer_Release(&r_compat);
+    PyBuffer_Release(&r_tissue);
+    PyBuffer_Release(&r_len);
+    return result;
+}
+
+static PyMethodDef methods[] = {
+    {"count_compat", count_compat, METH_VARARGS,
+     "count_compat(d_blood, d_tissue, r_compat, r_tissue, r_len, n_words) -> int\n\n"
+     "Count compatible (donor, recipient) pairs over packed mask buffers."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT, "_netflow_compat",
+    "C donor x recipient compatibility count.", -1, methods,
+};
+
+PyMODINIT_FUNC
+PyInit__netflow_compat(void)
+{
+    return PyModule_Create(&module);
+}
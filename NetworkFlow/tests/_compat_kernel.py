@@ -0,0 +1,136 @@
+"""Compiled donor x recipient compatibility kernels for the validation helpers.
+
+``compat_matrix`` mirrors the NumPy path of ``_compat_matrix`` over packed
+uint64 blood masks and (n, words) uint64 tissue rows, parallelised over donor
+rows with ``prange``; ``count_compat`` counts the compatible pairs of one donor
+slice for thread-pool fan-out; ``validate_fused`` runs checks 2-4 of
+``validate_matching`` in one pass over the matches. All are JIT-compiled with
+numba when installed and release the GIL; callers should check
+``NUMBA_AVAILABLE`` and otherwise stay on the NumPy path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Identity decorator used when numba is not installed."""
+
+        def decorate(func):
+            return func
+
+        return decorate
+
+
+# Result codes for validate_fused and the NumPy checks in validation.py; the
+# UNKNOWN_* codes come from the id check that runs before either.
+VALID = 0
+DUPLICATE_RECIPIENT = 1
+OVER_CAPACITY = 2
+BLOOD_MISMATCH = 3
+TISSUE_MISMATCH = 4
+UNKNOWN_DONOR = 5
+UNKNOWN_RECIPIENT = 6
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+@njit(cache=True)
+def _popcount64(x):
+    """Number of set bits in a uint64 (SWAR bit count)."""
+
+    x = x - ((x >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x = (x + (x >> np.uint64(4))) & _M4
+    return np.int64((x * _H01) >> np.uint64(56))
+
+
+@njit(cache=True)
+def _shared_markers(a, b):
+    """Number of bits set in both tissue rows ``a`` and ``b``."""
+
+    count = 0
+    for w in range(a.shape[0]):
+        count += _popcount64(a[w] & b[w])
+    return count
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def compat_matrix(d_blood, d_tissue, r_compat, r_tissue, r_len):
+    """Boolean (donor, recipient) compatibility matrix; ``r_len`` is the recipient popcount."""
+
+    compat = np.zeros((d_blood.shape[0], r_compat.shape[0]), dtype=np.bool_)
+    for i in prange(d_blood.shape[0]):
+        for j in range(r_compat.shape[0]):
+            if d_blood[i] & r_compat[j]:
+                if r_len[j] == 0 or 2 * _shared_markers(d_tissue[i], r_tissue[j]) >= r_len[j]:
+                    compat[i, j] = True
+    return compat
+
+
+@njit(nogil=True, cache=True)
+def count_compat(d_blood, d_tissue, r_compat, r_tissue, r_len):
+    """Count compatible (donor, recipient) pairs; ``r_len`` is the recipient popcount."""
+
+    total = 0
+    for i in range(d_blood.shape[0]):
+        for j in range(r_compat.shape[0]):
+            if d_blood[i] & r_compat[j]:
+                if r_len[j] == 0 or 2 * _shared_markers(d_tissue[i], r_tissue[j]) >= r_len[j]:
+                    total += 1
+    return total
+
+
+@njit(nogil=True, cache=True)
+def validate_fused(donor_ids, r_ids, caps, d_blood, d_tissue, r_compat, r_tissue, r_len):
+    """Check a matching in one sweep; return (code, row, extra) of the failure to report.
+
+    Ids must already be in range. Failures are ranked like the separate checks:
+    a repeated recipient beats over-capacity, which beats the first incompatible
+    pair. The over-capacity row is the first match of a donor whose total usage
+    exceeds its organs, found by a second sweep only when some donor is over.
+    ``extra`` is that usage for OVER_CAPACITY, the shared marker count for
+    TISSUE_MISMATCH, and 0 otherwise.
+    """
+
+    usage = np.zeros(caps.shape[0], dtype=np.int64)
+    seen = np.zeros(r_compat.shape[0], dtype=np.bool_)
+    over = False
+    compat_code = VALID
+    compat_row = -1
+    compat_extra = 0
+    for i in range(donor_ids.shape[0]):
+        d = donor_ids[i]
+        r = r_ids[i]
+        if seen[r]:
+            return DUPLICATE_RECIPIENT, i, 0
+        seen[r] = True
+        usage[d] += 1
+        if usage[d] > caps[d]:
+            over = True
+        if compat_code == VALID:
+            if not (d_blood[d] & r_compat[r]):
+                compat_code = BLOOD_MISMATCH
+                compat_row = i
+            elif r_len[r] > 0:
+                match_count = _shared_markers(d_tissue[d], r_tissue[r])
+                if 2 * match_count < r_len[r]:
+                    compat_code = TISSUE_MISMATCH
+                    compat_row = i
+                    compat_extra = match_count
+    if over:
+        for i in range(donor_ids.shape[0]):
+            if usage[donor_ids[i]] > caps[donor_ids[i]]:
+                return OVER_CAPACITY, i, usage[donor_ids[i]]
+    return compat_code, compat_row, compat_extra
@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
+import importlib.util
+import random
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from organ_transplant_flow import OrganTransplantNetworkFlow, generate_transplant_case
-from validation import validate_matching, count_compatible_pairs, analyze_network_structure
+from _compat_build import build as build_compat
+from organ_transplant_flow import (
+    MAX_MASK_BITS, OrganTransplantNetworkFlow, generate_transplant_case, marker_registry, tissue_mask,
+)
+import validation
+from validation import (
+    to_soa, validate_matching, make_validator, validate_matchings_batch, count_compatible_pairs,
+    count_compatible_pairs_threaded, analyze_network_structure,
+)
+
+
+def _random_mask(rng: random.Random, width: int, k: int) -> int:
+    """Int tissue mask with k distinct bits below width."""
+    return sum(1 << bit for bit in rng.sample(range(width), k))
 
 
 class TestOrganTransplantFlow(unittest.TestCase):
@@ -130,6 +146,161 @@ class TestOrganTransplantFlow(unittest.TestCase):
         for recipient_id, count in recipient_matches.items():
             self.assertEqual(count, 1, f"Recipient {recipient_id} matched {count} times")
     
+    def test_dinic_matches_edmonds_karp(self):
+        """Test that Dinic's algorithm finds the same maximum flow as Edmonds-Karp."""
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                donors, recipients = generate_transplant_case(12, 10, seed=seed)
+                solver = OrganTransplantNetworkFlow(donors, recipients)
+                expected, _, _ = solver.ford_fulkerson_edmonds_karp()
+                max_flow, matches, _ = solver.dinic()
+                
+                self.assertEqual(max_flow, expected)
+                valid, msg = validate_matching(donors, recipients, matches, max_flow)
+                self.assertTrue(valid, f"Seed {seed}: {msg}")
+    
+    def test_hopcroft_karp_matches_edmonds_karp(self):
+        """Test Hopcroft-Karp, including donors with several organs, against Edmonds-Karp."""
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                donors, recipients = generate_transplant_case(12, 10, seed=seed)
+                solver = OrganTransplantNetworkFlow(donors, recipients)
+                expected, _, _ = solver.ford_fulkerson_edmonds_karp()
+                max_flow, matches, _ = solver.hopcroft_karp()
+                
+                self.assertEqual(max_flow, expected)
+                valid, msg = validate_matching(donors, recipients, matches, max_flow)
+                self.assertTrue(valid, f"Seed {seed}: {msg}")
+    
+    def test_tissue_bitmasks_match_marker_sets(self):
+        """Test that bitmask tissue markers give the same matching as marker sets."""
+        donors = [
+            (1, 'O', {'HLA-1', 'HLA-2'}),
+            (1, 'A', {'HLA-3', 'HLA-4'}),
+        ]
+        recipients = [
+            (['O', 'A'], {'HLA-3'}, 5),
+            (['O'], {'HLA-1', 'HLA-5'}, 8),
+        ]
+        self.assertEqual(tissue_mask({'HLA-1', 'HLA-2'}), 0b110)
+        
+        masked_donors = [(n, b, tissue_mask(t)) for n, b, t in donors]
+        masked_recipients = [(c, tissue_mask(t), u) for c, t, u in recipients]
+        
+        expected = OrganTransplantNetworkFlow(donors, recipients).ford_fulkerson_edmonds_karp()
+        result = OrganTransplantNetworkFlow(
+            masked_donors, masked_recipients
+        ).ford_fulkerson_edmonds_karp()
+        self.assertEqual(result[:2], expected[:2])
+        self.assertEqual(result[0], 2)
+        
+        # Non-HLA names get bits from a per-case registry in the solver and in validation
+        named_donors = [(1, 'O', {'DQ-7', 'DR-9'}), (1, 'A', {'DQ-7'})]
+        named_recipients = [(['O', 'A'], {'DQ-7', 'DR-9'}, 5), (['A'], {'DQ-7'}, 3)]
+        self.assertEqual(OrganTransplantNetworkFlow(named_donors, named_recipients).dinic()[0], 2)
+        self.assertTrue(validate_matching(named_donors, named_recipients, [(0, 0), (1, 1)], 2)[0])
+        self.assertEqual(count_compatible_pairs(named_donors, named_recipients), 3)
+    
+    def test_tissue_mask_registry(self):
+        """Test that marker bits do not depend on earlier calls and stay within MAX_MASK_BITS."""
+        with self.assertRaises(ValueError):
+            tissue_mask({'HLA-1', 'DQ-7'})
+        # A fresh registry always gives the first non-HLA name the first free bit
+        self.assertEqual(tissue_mask({'DQ-7'}, marker_registry()), 1 << len(marker_registry()))
+        
+        registry = marker_registry()
+        tissue_mask({f"DQ-{k}" for k in range(MAX_MASK_BITS - len(registry))}, registry)
+        with self.assertRaises(ValueError):
+            tissue_mask({'DR-1'}, registry)
+    
+    def test_scalar_compatibility_matches_check_compatibility(self):
+        """Test that the wide-alphabet compatibility fallback agrees with _check_compatibility."""
+        rng = random.Random(3)
+        # Tissue masks wider than 64 bits force the scalar (Python int) path
+        labels = ['O', 'A', 'B', 'AB', 'X']
+        donors = [(1, rng.choice(labels), _random_mask(rng, 80, rng.randint(0, 8))) for _ in range(12)]
+        donors.append((1, 'O', (1 << 80) - 1))
+        recipients = [(rng.sample(labels, rng.randint(1, 3)), _random_mask(rng, 80, rng.randint(0, 6)), 5)
+                      for _ in range(10)]
+        solver = OrganTransplantNetworkFlow(donors, recipients)
+        expected = [
+            [
+                solver._check_compatibility(d_blood, d_tissue, r_blood, r_tissue)
+                for r_blood, r_tissue, _ in solver.recipients
+            ]
+            for _, d_blood, d_tissue in solver.donors
+        ]
+        self.assertEqual(solver._compatibility_matrix().tolist(), expected)
+    
+    def test_make_validator_matches_validate_matching(self):
+        """Test that a prebuilt validator agrees with validate_matching."""
+        donors, recipients = generate_transplant_case(10, 12, seed=7)
+        max_flow, matches, _ = OrganTransplantNetworkFlow(donors, recipients).dinic()
+        validate = make_validator(donors, recipients)
+        
+        candidates = [
+            (matches, max_flow),
+            (matches, max_flow + 1),
+            (matches + matches[:1], max_flow + 1),
+            ([(d, r) for d in range(len(donors)) for r in range(len(recipients))][:5], 5),
+        ]
+        for candidate, flow in candidates:
+            self.assertEqual(
+                validate(candidate, flow),
+                validate_matching(donors, recipients, candidate, flow),
+            )
+        self.assertTrue(validate(matches, max_flow)[0])
+    
+    def test_validate_matching_reads_only_matched_rows(self):
+        """Test that one-shot validation never touches rows outside the matching."""
+        donors, recipients = generate_transplant_case(10, 12, seed=7)
+        max_flow, matches, _ = OrganTransplantNetworkFlow(donors, recipients).dinic()
+        expected = validate_matching(donors, recipients, matches, max_flow)
+        
+        # Rows no match references are replaced by values no check can read
+        used_donors = {d for d, _ in matches}
+        used_recipients = {r for _, r in matches}
+        sparse_donors = [row if i in used_donors else None for i, row in enumerate(donors)]
+        sparse_recipients = [row if j in used_recipients else None for j, row in enumerate(recipients)]
+        self.assertEqual(validate_matching(sparse_donors, sparse_recipients, matches, max_flow), expected)
+        self.assertTrue(expected[0])
+    
+    def test_validate_rejects_unknown_ids(self):
+        """Test that negative or too-large ids fail instead of wrapping onto real rows."""
+        donors = [(1, 'O', {'HLA-1'}), (1, 'O', {'HLA-1'})]
+        recipients = [(['O'], {'HLA-1'}, 5), (['O'], {'HLA-1'}, 5)]
+        
+        # Donor -1 would alias donor 1 and hide its over-capacity use
+        valid, msg = validate_matching(donors, recipients, [(1, 0), (-1, 1)], 2)
+        self.assertFalse(valid)
+        self.assertIn("Donor -1 out of range", msg)
+        
+        valid, msg = validate_matching(donors, recipients, [(0, 0), (1, 2)], 2)
+        self.assertFalse(valid)
+        self.assertIn("Recipient 2 out of range", msg)
+    
+    def test_validate_matchings_batch(self):
+        """Test batched validation against validate_matching row by row."""
+        donors, recipients = generate_transplant_case(8, 10, seed=3)
+        max_flow, matches, _ = OrganTransplantNetworkFlow(donors, recipients).dinic()
+        rng = random.Random(3)
+        
+        batch = [matches]
+        for _ in range(20):
+            candidate = list(matches)
+            k = rng.randrange(len(candidate))
+            candidate[k] = (rng.randrange(len(donors)), rng.randrange(len(recipients)))
+            batch.append(candidate)
+        # Unknown ids fail their own row only, as validate_matching reports them
+        for bad in [(-1, 0), (len(donors), 0), (0, -1), (0, len(recipients))]:
+            batch.append([bad] + list(matches[1:]))
+        flows = [max_flow] * (len(batch) - 1) + [max_flow + 1]
+        
+        result = validate_matchings_batch(donors, recipients, batch, flows)
+        expected = [validate_matching(donors, recipients, m, f)[0] for m, f in zip(batch, flows)]
+        self.assertEqual(result.tolist(), expected)
+        self.assertTrue(result[0])
+    
     def test_utility_functions(self):
         """Test validation and analysis utilities."""
         donors = [(1, 'O', {'HLA-1'})]
@@ -139,11 +310,86 @@ class TestOrganTransplantFlow(unittest.TestCase):
         count = count_compatible_pairs(donors, recipients)
         self.assertEqual(count, 1)
         
+        # Test threaded counting agrees with the single-pass count
+        donors_big, recipients_big = generate_transplant_case(30, 25, seed=11)
+        for workers in (1, 3, 64):
+            self.assertEqual(
+                count_compatible_pairs_threaded(donors_big, recipients_big, workers=workers),
+                count_compatible_pairs(donors_big, recipients_big),
+            )
+        
         # Test network analysis
         analysis = analyze_network_structure(donors, recipients)
         self.assertEqual(analysis['n_donors'], 1)
         self.assertEqual(analysis['n_recipients'], 1)
         self.assertEqual(analysis['total_organs'], 1)
+    
+    def test_compatible_count_is_cached(self):
+        """Test that repeat counts on one instance reuse the first D x R scan."""
+        donors, recipients = generate_transplant_case(12, 9, seed=21)
+        validation._cached_count.cache_clear()
+        count = count_compatible_pairs(donors, recipients)
+        
+        self.assertEqual(count_compatible_pairs(donors, recipients), count)
+        self.assertEqual(analyze_network_structure(donors, recipients)['compatible_pairs'], count)
+        info = validation._cached_count.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+        
+        D, R = to_soa(donors, recipients)
+        self.assertEqual(int(validation._compat_matrix(D, R).sum()), count)
+
+
+class TestCompatExtension(unittest.TestCase):
+    """Test the optional C pair count against the NumPy/numba path."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls._build_dir = tempfile.TemporaryDirectory()
+        try:
+            target = build_compat(Path(cls._build_dir.name))
+        except RuntimeError as exc:
+            cls._build_dir.cleanup()
+            raise unittest.SkipTest(str(exc))
+        spec = importlib.util.spec_from_file_location("_netflow_compat", target)
+        cls.ext = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.ext)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls._build_dir.cleanup()
+    
+    def _cases(self):
+        yield generate_transplant_case(30, 25, seed=11)
+        yield generate_transplant_case(1, 0, seed=2)
+        # Masks past bit 63 widen the tissue rows to several uint64 words
+        rng = random.Random(5)
+        donors = [(1, rng.choice('OABX'), _random_mask(rng, 150, 40)) for _ in range(20)]
+        recipients = [(rng.sample(['O', 'A', 'B', 'AB', 'X'], 2), _random_mask(rng, 150, rng.randint(0, 6)), 5)
+                      for _ in range(15)]
+        yield donors, recipients
+    
+    def test_count_matches_fallback(self):
+        """Test that the C count equals the NumPy/numba count, directly and via validation."""
+        for donors, recipients in self._cases():
+            D, R = to_soa(donors, recipients)
+            expected = int(validation._compat_matrix(D, R).sum())
+            self.assertEqual(
+                self.ext.count_compat(D.blood, D.tissue, R.compat, R.tissue, R.tissue_len, R.tissue.shape[1]),
+                expected,
+            )
+            with mock.patch.object(validation, "_netflow_compat", self.ext):
+                validation._cached_count.cache_clear()
+                self.assertEqual(count_compatible_pairs(donors, recipients), expected)
+                for workers in (1, 3):
+                    self.assertEqual(count_compatible_pairs_threaded(donors, recipients, workers=workers), expected)
+    
+    def test_rejects_mismatched_buffers(self):
+        """Test that buffers of inconsistent length raise instead of reading past the end."""
+        D, R = to_soa(*generate_transplant_case(4, 3, seed=1))
+        with self.assertRaises(ValueError):
+            self.ext.count_compat(D.blood, D.tissue, R.compat, R.tissue[:-1], R.tissue_len, R.tissue.shape[1])
+        with self.assertRaises(ValueError):
+            self.ext.count_compat(D.blood, D.tissue, R.compat, R.tissue, R.tissue_len, 0)
 
 
 if __name__ == "__main__":
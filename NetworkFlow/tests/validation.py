@@ -2,7 +2,142 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple, Set
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, List, Tuple, Set, Union
+
+import numpy as np
+
+# Tissue masks and popcount come from the solver module so both sides share one
+# marker -> bit registry.
+try:
+    from ..organ_transplant_flow import (
+        BLOOD_TYPES, blood_bit, blood_compat_mask, marker_registry, popcount, tissue_mask,
+    )
+except ImportError:
+    from organ_transplant_flow import (
+        BLOOD_TYPES, blood_bit, blood_compat_mask, marker_registry, popcount, tissue_mask,
+    )
+
+try:
+    from ._compat_kernel import (
+        BLOOD_MISMATCH, DUPLICATE_RECIPIENT, NUMBA_AVAILABLE, OVER_CAPACITY, TISSUE_MISMATCH,
+        UNKNOWN_DONOR, UNKNOWN_RECIPIENT, VALID,
+        compat_matrix, count_compat, validate_fused,
+    )
+except ImportError:
+    from _compat_kernel import (
+        BLOOD_MISMATCH, DUPLICATE_RECIPIENT, NUMBA_AVAILABLE, OVER_CAPACITY, TISSUE_MISMATCH,
+        UNKNOWN_DONOR, UNKNOWN_RECIPIENT, VALID,
+        compat_matrix, count_compat, validate_fused,
+    )
+
+try:
+    from .. import _netflow_compat
+except ImportError:
+    try:
+        import _netflow_compat
+    except ImportError:  # pragma: no cover - optional C build, see _compat_build.py
+        _netflow_compat = None
+
+# Blood types and tissue markers are compared as bitmasks from the solver module:
+# blood_bit / blood_compat_mask for blood types (O, A, B, AB are bits 0-3, other
+# labels get later bits) and tissue_mask for markers (HLA-k is bit k, other
+# names get later bits in a per-case marker_registry()).
+#
+# Tissue masks are stored as rows of little-endian uint64 words.
+_WORD_BITS = 64
+
+
+@dataclass
+class Donors:
+    """Donor fields as parallel arrays, indexed by donor id."""
+    n: np.ndarray
+    blood: np.ndarray
+    tissue: np.ndarray
+
+
+@dataclass
+class Recipients:
+    """Recipient fields as parallel arrays, indexed by recipient id."""
+    compat: np.ndarray
+    tissue: np.ndarray
+    tissue_len: np.ndarray
+    urgency: np.ndarray
+
+
+def to_soa(
+    donors: List[Tuple[int, str, Set[str]]],
+    recipients: List[Tuple[List[str], Set[str], int]]
+) -> Tuple[Donors, Recipients]:
+    """
+    Pack donor and recipient tuples into parallel arrays.
+    
+    Blood types become bits (recipients hold the OR of every accepted type) and
+    tissue markers become bitmasks. Tissue arrays have one row of uint64 words
+    per donor/recipient, with as many words as the widest mask needs (one for
+    the standard HLA panel), so larger marker panels stay on the same path.
+    """
+    markers = marker_registry()
+    d_tissue = [tissue_mask(d_tissue, markers) for _, _, d_tissue in donors]
+    r_tissue = [tissue_mask(r_tissue, markers) for _, r_tissue, _ in recipients]
+    n_words = max(1, -(-max(d_tissue + r_tissue, default=0).bit_length() // _WORD_BITS))
+    
+    D = Donors(
+        n=np.array([num for num, _, _ in donors], dtype=np.int64),
+        blood=np.array([blood_bit(d_blood) for _, d_blood, _ in donors], dtype=np.uint64),
+        tissue=_words(d_tissue, n_words),
+    )
+    R = Recipients(
+        compat=np.array([blood_compat_mask(tuple(r_blood_compat)) for r_blood_compat, _, _ in recipients], dtype=np.uint64),
+        tissue=_words(r_tissue, n_words),
+        tissue_len=np.array([mask.bit_count() for mask in r_tissue], dtype=np.int64),
+        urgency=np.array([urgency for _, _, urgency in recipients], dtype=np.int64),
+    )
+    return D, R
+
+
+def _words(masks: List[int], n_words: int) -> np.ndarray:
+    """Int bitmasks as an (len(masks), n_words) array of uint64 words, low word first."""
+    if n_words == 1:
+        return np.array(masks, dtype=np.uint64).reshape(len(masks), 1)
+    n_bytes = n_words * _WORD_BITS // 8
+    raw = b"".join(mask.to_bytes(n_bytes, "little") for mask in masks)
+    return np.frombuffer(raw, dtype="<u8").astype(np.uint64).reshape(len(masks), n_words)
+
+
+def _shared_markers(d_tissue: np.ndarray, r_tissue: np.ndarray) -> np.ndarray:
+    """Marker count of each pair of tissue rows, summed over words."""
+    return popcount(d_tissue & r_tissue).sum(axis=-1, dtype=np.int64)
+
+
+# Error message per failure code, formatted only once a check has failed. Each
+# takes (donor_id, recipient_id, extra, donors, recipients), where extra is the
+# donor's usage for OVER_CAPACITY and the shared marker count for TISSUE_MISMATCH.
+_FAILURE_MESSAGES = {
+    UNKNOWN_DONOR: lambda d, r, extra, donors, recipients: (
+        f"Donor {d} out of range: expected 0 <= id < {len(donors)}"
+    ),
+    UNKNOWN_RECIPIENT: lambda d, r, extra, donors, recipients: (
+        f"Recipient {r} out of range: expected 0 <= id < {len(recipients)}"
+    ),
+    DUPLICATE_RECIPIENT: lambda d, r, extra, donors, recipients: (
+        f"Recipient {r} matched multiple times"
+    ),
+    OVER_CAPACITY: lambda d, r, extra, donors, recipients: (
+        f"Donor {d} exceeds capacity: {extra} > {donors[d][0]}"
+    ),
+    BLOOD_MISMATCH: lambda d, r, extra, donors, recipients: (
+        f"Blood incompatible: Donor {d} ({donors[d][1]}) → Recipient {r} (needs {recipients[r][0]})"
+    ),
+    TISSUE_MISMATCH: lambda d, r, extra, donors, recipients: (
+        f"Tissue incompatible: Donor {d} → Recipient {r} (only {extra}/{tissue_mask(recipients[r][1], marker_registry()).bit_count()} markers match)"
+    ),
+}
 
 
 def validate_matching(
@@ -16,6 +151,8 @@ def validate_matching(
     
     Checks:
     1. Flow value equals number of matches
+       (then every donor and recipient id must index the lists; negative ids
+       are rejected rather than wrapped)
     2. No recipient matched more than once
     3. Donor capacity constraints respected
     4. All matches are medically compatible
@@ -32,40 +169,216 @@ def validate_matching(
     # Check 1: Flow equals matches
     if max_flow != len(matches):
         return False, f"Flow value {max_flow} doesn't match number of matches {len(matches)}"
+    return _result(*_check_matched_rows(donors, recipients, matches), matches, donors, recipients)
+
+
+def make_validator(
+    donors: List[Tuple[int, str, Set[str]]],
+    recipients: List[Tuple[List[str], Set[str], int]]
+) -> Callable[[List[Tuple[int, int]], int], Tuple[bool, str]]:
+    """
+    Build a validator for many matchings of one problem instance.
     
-    # Check 2: No recipient matched twice
-    recipient_used = set()
-    for _, recipient_id in matches:
-        if recipient_id in recipient_used:
-            return False, f"Recipient {recipient_id} matched multiple times"
-        recipient_used.add(recipient_id)
+    Donors and recipients are packed once (O(D + R)), after which each call of
+    the returned validate(matches, max_flow) runs vectorised or compiled checks
+    over the matches and gives the same result as validate_matching.
+    """
+    D, R = to_soa(donors, recipients)
     
-    # Check 3: Donor capacity constraints
-    donor_usage = {}
-    for donor_id, _ in matches:
-        donor_usage[donor_id] = donor_usage.get(donor_id, 0) + 1
+    def validate(matches: List[Tuple[int, int]], max_flow: int) -> Tuple[bool, str]:
+        # Check 1: Flow equals matches
+        if max_flow != len(matches):
+            return False, f"Flow value {max_flow} doesn't match number of matches {len(matches)}"
+        
+        matches_arr = np.fromiter(chain.from_iterable(matches), dtype=np.int64, count=2 * len(matches)).reshape(-1, 2)
+        d_idx = matches_arr[:, 0]
+        r_idx = matches_arr[:, 1]
+        
+        # Every id must index the arrays before checks 2-4 gather by it
+        code, k = _check_ids(d_idx, r_idx, len(donors), len(recipients))
+        extra = 0
+        if code == VALID:
+            # Checks 2-4, in one compiled pass when numba is available
+            if NUMBA_AVAILABLE:
+                code, k, extra = validate_fused(d_idx, r_idx, D.n, D.blood, D.tissue, R.compat, R.tissue, R.tissue_len)
+            else:
+                code, k, extra = _check_arrays(d_idx, r_idx, D, R)
+        return _result(code, k, extra, matches, donors, recipients)
+    
+    return validate
+
+
+def _result(
+    code: int,
+    k: int,
+    extra: int,
+    matches: List[Tuple[int, int]],
+    donors: List[Tuple[int, str, Set[str]]],
+    recipients: List[Tuple[List[str], Set[str], int]]
+) -> Tuple[bool, str]:
+    """(is_valid, error_message) for a check result code and the row it refers to."""
+    if code == VALID:
+        return True, "Valid matching"
+    donor_id, recipient_id = matches[k]
+    return False, _FAILURE_MESSAGES[code](donor_id, recipient_id, int(extra), donors, recipients)
+
+
+def _check_matched_rows(
+    donors: List[Tuple[int, str, Set[str]]],
+    recipients: List[Tuple[List[str], Set[str], int]],
+    matches: List[Tuple[int, int]]
+) -> Tuple[int, int, int]:
+    """
+    Checks for a single matching, reading only the rows it references.
     
-    for donor_id, count in donor_usage.items():
-        num_organs, _, _ = donors[donor_id]
-        if count > num_organs:
-            return False, f"Donor {donor_id} exceeds capacity: {count} > {num_organs}"
+    Returns the same (code, row, extra) as validate_fused. A one-shot call
+    cannot amortise packing all D + R rows, so only the matched rows are
+    converted: blood types to blood_bit / blood_compat_mask and tissue markers to
+    tissue_mask ints, compared with AND and bit_count.
+    """
+    if not matches:
+        return VALID, -1, 0
+    n_donors, n_recipients = len(donors), len(recipients)
+    donor_ids, recipient_ids = zip(*matches)
+    if (min(donor_ids) < 0 or max(donor_ids) >= n_donors
+            or min(recipient_ids) < 0 or max(recipient_ids) >= n_recipients):
+        for k, (donor_id, recipient_id) in enumerate(matches):
+            if not 0 <= donor_id < n_donors:
+                return UNKNOWN_DONOR, k, 0
+            if not 0 <= recipient_id < n_recipients:
+                return UNKNOWN_RECIPIENT, k, 0
     
-    # Check 4: Medical compatibility
-    for donor_id, recipient_id in matches:
+    # Check 2: No recipient matched twice, as a length compare of the distinct ids
+    if len(set(recipient_ids)) < len(matches):
+        # The first repeat is the first row that is not its recipient's first row
+        first_row = dict(zip(reversed(recipient_ids), range(len(matches) - 1, -1, -1)))
+        k = next(k for k, recipient_id in enumerate(recipient_ids) if first_row[recipient_id] != k)
+        return DUPLICATE_RECIPIENT, k, 0
+    
+    # Check 3: Donor capacity constraints
+    usage = Counter(donor_ids)
+    over = {donor_id for donor_id, count in usage.items() if count > donors[donor_id][0]}
+    if over:
+        # Report the first over-capacity donor in match order.
+        k = next(k for k, donor_id in enumerate(donor_ids) if donor_id in over)
+        return OVER_CAPACITY, k, usage[donor_ids[k]]
+    
+    # Check 4: Medical compatibility of each matched pair, as bitmasks
+    markers = marker_registry()
+    for k, (donor_id, recipient_id) in enumerate(matches):
         _, d_blood, d_tissue = donors[donor_id]
         r_blood_compat, r_tissue, _ = recipients[recipient_id]
-        
-        # Blood compatibility
-        if d_blood not in r_blood_compat:
-            return False, f"Blood incompatible: Donor {donor_id} ({d_blood}) → Recipient {recipient_id} (needs {r_blood_compat})"
-        
+        if not blood_bit(d_blood) & blood_compat_mask(tuple(r_blood_compat)):
+            return BLOOD_MISMATCH, k, 0
         # Tissue compatibility (50% match required)
-        if len(r_tissue) > 0:
-            match_count = len(d_tissue & r_tissue)
-            if match_count < len(r_tissue) * 0.5:
-                return False, f"Tissue incompatible: Donor {donor_id} → Recipient {recipient_id} (only {match_count}/{len(r_tissue)} markers match)"
+        r_mask = r_tissue if type(r_tissue) is int else tissue_mask(r_tissue, markers)
+        if r_mask:
+            d_mask = d_tissue if type(d_tissue) is int else tissue_mask(d_tissue, markers)
+            match_count = (d_mask & r_mask).bit_count()
+            if 2 * match_count < r_mask.bit_count():
+                return TISSUE_MISMATCH, k, match_count
+    
+    return VALID, -1, 0
+
+
+def _check_ids(d_idx: np.ndarray, r_idx: np.ndarray, n_donors: int, n_recipients: int) -> Tuple[int, int]:
+    """Find the first match whose donor or recipient id is negative or too large; return (code, row)."""
+    bad_donor = (d_idx < 0) | (d_idx >= n_donors)
+    bad = np.flatnonzero(bad_donor | (r_idx < 0) | (r_idx >= n_recipients))
+    if bad.size:
+        k = int(bad[0])
+        return (UNKNOWN_DONOR if bad_donor[k] else UNKNOWN_RECIPIENT), k
+    return VALID, -1
+
+
+def _check_arrays(d_idx: np.ndarray, r_idx: np.ndarray, D: Donors, R: Recipients) -> Tuple[int, int, int]:
+    """Checks 2-4 of validate_matching as whole-array passes; return (code, row, extra).
+    
+    Ids must already have passed _check_ids.
+    """
+    # Check 2: No recipient matched twice
+    order = np.argsort(r_idx, kind="stable")
+    repeat = np.flatnonzero(np.diff(r_idx[order]) == 0)
+    if repeat.size:
+        # A stable sort keeps match order within each recipient, so the later
+        # row of every equal neighbour pair is a repeat; report the earliest.
+        return DUPLICATE_RECIPIENT, int(order[repeat + 1].min()), 0
+    
+    # Check 3: Donor capacity constraints
+    caps = D.n[d_idx]
+    usage = np.bincount(d_idx, minlength=len(D.n))
+    over = usage[d_idx] > caps
+    if over.any():
+        # Report the first over-capacity donor in match order.
+        k = int(np.argmax(over))
+        return OVER_CAPACITY, k, int(usage[d_idx[k]])
+    
+    # Check 4: Medical compatibility, over all matches at once
+    blood_ok = (D.blood[d_idx] & R.compat[r_idx]) != 0
+    match_count = _shared_markers(D.tissue[d_idx], R.tissue[r_idx])
+    r_tissue_len = R.tissue_len[r_idx]
+    # Tissue compatibility (50% match required)
+    tissue_ok = (r_tissue_len == 0) | (2 * match_count >= r_tissue_len)
+    
+    bad = np.flatnonzero(~(blood_ok & tissue_ok))
+    if bad.size:
+        k = int(bad[0])
+        if not blood_ok[k]:
+            return BLOOD_MISMATCH, k, 0
+        return TISSUE_MISMATCH, k, int(match_count[k])
+    
+    return VALID, -1, 0
+
+
+def validate_matchings_batch(
+    donors: List[Tuple[int, str, Set[str]]],
+    recipients: List[Tuple[List[str], Set[str], int]],
+    matches_batch: np.ndarray,
+    flows: np.ndarray
+) -> np.ndarray:
+    """
+    Validate B candidate matchings of the same size at once.
     
-    return True, "Valid matching"
+    Applies the same four checks as validate_matching to every row, without
+    error messages; rows with an out-of-range donor or recipient id are False.
+    
+    Args:
+        donors: List of (num_organs, blood_type, tissue_markers)
+        recipients: List of (compatible_blood_types, tissue_markers, urgency)
+        matches_batch: (B, M, 2) array of (donor_id, recipient_id) pairs
+        flows: Claimed maximum flow value of each matching, shape (B,)
+    
+    Returns:
+        Boolean array of shape (B,), True where the matching is valid
+    """
+    D, R = to_soa(donors, recipients)
+    matches_batch = np.asarray(matches_batch, dtype=np.int64)
+    # Empty matchings carry no M in their shape
+    matches_batch = matches_batch.reshape(len(flows), -1 if matches_batch.size else 0, 2)
+    n_matches = matches_batch.shape[1]
+    d_ids = matches_batch[..., 0]
+    r_ids = matches_batch[..., 1]
+    
+    # Check 1: Flow equals matches, and every id indexes the lists (rows that
+    # fail here are masked out before checks 2-4 gather by their ids)
+    in_range = ((d_ids >= 0) & (d_ids < len(D.n)) & (r_ids >= 0) & (r_ids < len(R.compat))).all(axis=1)
+    valid = (np.asarray(flows) == n_matches) & in_range
+    d_ids = d_ids[in_range]
+    r_ids = r_ids[in_range]
+    n_batch = len(d_ids)
+    
+    # Check 2: No recipient matched twice
+    ok = ~(np.diff(np.sort(r_ids, axis=1), axis=1) == 0).any(axis=1)
+    
+    # Check 3: Donor capacity constraints, one bincount over (row, donor) cells
+    cells = (np.arange(n_batch)[:, None] * len(D.n) + d_ids).ravel()
+    usage = np.bincount(cells, minlength=n_batch * len(D.n)).reshape(n_batch, len(D.n))
+    ok &= (usage <= D.n).all(axis=1)
+    
+    # Check 4: Medical compatibility
+    ok &= _compat_matrix(D, R)[d_ids, r_ids].all(axis=1)
+    valid[in_range] &= ok
+    return valid
 
 
 def count_compatible_pairs(
@@ -77,22 +390,109 @@ def count_compatible_pairs(
     
     Useful for understanding the problem structure.
     """
-    count = 0
-    for i, (_, d_blood, d_tissue) in enumerate(donors):
-        for j, (r_blood_compat, r_tissue, _) in enumerate(recipients):
-            # Blood check
-            if d_blood not in r_blood_compat:
-                continue
-            
-            # Tissue check
-            if len(r_tissue) > 0:
-                match_count = len(d_tissue & r_tissue)
-                if match_count < len(r_tissue) * 0.5:
-                    continue
-            
-            count += 1
+    return _cached_count(_Packed(*to_soa(donors, recipients)))
+
+
+class _Packed:
+    """Packed D and R, hashed and compared by their array contents."""
+    __slots__ = ("D", "R", "_key")
+    
+    def __init__(self, D: Donors, R: Recipients):
+        self.D = D
+        self.R = R
+        self._key = (R.tissue.shape[1], D.blood.tobytes(), D.tissue.tobytes(), R.compat.tobytes(), R.tissue.tobytes())
+    
+    def __hash__(self) -> int:
+        return hash(self._key)
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Packed) and self._key == other._key
+
+
+@lru_cache(maxsize=8)
+def _cached_count(packed: _Packed) -> int:
+    """
+    Compatible pair count of one packed instance.
+    
+    Memoized on the byte views of the packed arrays, so separate to_soa calls
+    on the same donors and recipients (count_compatible_pairs, then
+    analyze_network_structure) share one D x R scan.
+    """
+    D, R = packed.D, packed.R
+    if _netflow_compat is not None:
+        return _c_count(D.blood, D.tissue, R)
+    return int(_compat_matrix(D, R).sum())
+
+
+def _c_count(d_blood: np.ndarray, d_tissue: np.ndarray, R: Recipients) -> int:
+    """Compatible pair count for a donor slice via the C extension."""
+    return _netflow_compat.count_compat(
+        np.ascontiguousarray(d_blood), np.ascontiguousarray(d_tissue),
+        R.compat, R.tissue, R.tissue_len, R.tissue.shape[1],
+    )
+
+
+def count_compatible_pairs_threaded(
+    donors: List[Tuple[int, str, Set[str]]],
+    recipients: List[Tuple[List[str], Set[str], int]],
+    workers: Union[int, None] = None
+) -> int:
+    """
+    Count compatible donor-recipient pairs, splitting donors across threads.
+    
+    Each thread counts one contiguous donor slice; the C extension, the numba
+    kernel and NumPy all release the GIL, so slices run concurrently. Unlike
+    count_compatible_pairs, no D x R matrix is materialized and the count is not cached.
+    """
+    D, R = to_soa(donors, recipients)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(D.n)))
+    
+    def count_slice(rows: np.ndarray) -> int:
+        lo, hi = (int(rows[0]), int(rows[-1]) + 1) if rows.size else (0, 0)
+        d_blood, d_tissue = D.blood[lo:hi], D.tissue[lo:hi]
+        if _netflow_compat is not None:
+            return _c_count(d_blood, d_tissue, R)
+        if NUMBA_AVAILABLE:
+            return int(count_compat(d_blood, d_tissue, R.compat, R.tissue, R.tissue_len))
+        blood_ok = (d_blood[:, None] & R.compat[None, :]) != 0
+        match_count = _shared_markers(d_tissue[:, None, :], R.tissue[None, :, :])
+        return int((blood_ok & ((R.tissue_len == 0)[None, :] | (2 * match_count >= R.tissue_len[None, :]))).sum())
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(count_slice, np.array_split(np.arange(len(D.n)), workers)))
+
+
+def _compat_matrix(D: Donors, R: Recipients) -> np.ndarray:
+    """Read-only donor x recipient compatibility matrix."""
+    if NUMBA_AVAILABLE:
+        compat = compat_matrix(D.blood, D.tissue, R.compat, R.tissue, R.tissue_len)
+    else:
+        blood_ok = (D.blood[:, None] & R.compat[None, :]) != 0
+        match_count = _shared_markers(D.tissue[:, None, :], R.tissue[None, :, :])
+        compat = blood_ok & ((R.tissue_len == 0)[None, :] | (2 * match_count >= R.tissue_len[None, :]))
     
-    return count
+    compat.setflags(write=False)
+    return compat
+
+
+def _recipient_key(blood_compat: List[str]) -> str:
+    """Most restrictive blood type of a recipient, used for counting."""
+    if 'O' in blood_compat and len(blood_compat) == 1:
+        return 'O'
+    if 'AB' in blood_compat and len(blood_compat) == 4:
+        return 'AB'
+    if 'A' in blood_compat and 'B' not in blood_compat:
+        return 'A'
+    if 'B' in blood_compat and 'A' not in blood_compat:
+        return 'B'
+    return 'other'
+
+
+# Bucket for every compatibility mask over the four standard types (O=1, A=2, B=4, AB=8)
+_MASK_TO_KEY = {
+    mask: _recipient_key([blood for blood in BLOOD_TYPES if mask & blood_bit(blood)])
+    for mask in range(16)
+}
 
 
 def analyze_network_structure(
@@ -104,29 +504,20 @@ def analyze_network_structure(
     
     Returns statistics about the problem instance.
     """
-    total_organs = sum(num for num, _, _ in donors)
-    total_recipients = len(recipients)
-    compatible_pairs = count_compatible_pairs(donors, recipients)
+    D, R = to_soa(donors, recipients)
+    total_organs = int(D.n.sum())
+    compatible_pairs = _cached_count(_Packed(D, R))
     
     # Blood type distribution
-    blood_types_donors = {}
-    for _, blood, _ in donors:
-        blood_types_donors[blood] = blood_types_donors.get(blood, 0) + 1
-    
-    blood_types_recipients = {}
-    for blood_compat, _, _ in recipients:
-        # Take most restrictive blood type for counting
-        if 'O' in blood_compat and len(blood_compat) == 1:
-            key = 'O'
-        elif 'AB' in blood_compat and len(blood_compat) == 4:
-            key = 'AB'
-        elif 'A' in blood_compat and 'B' not in blood_compat:
-            key = 'A'
-        elif 'B' in blood_compat and 'A' not in blood_compat:
-            key = 'B'
-        else:
-            key = 'other'
-        blood_types_recipients[key] = blood_types_recipients.get(key, 0) + 1
+    blood_types_donors = dict(Counter(blood for _, blood, _ in donors))
+    
+    # Recipients listing each standard type at most once are bucketed by their
+    # compatibility mask; repeated or unknown labels go through the label tests.
+    blood_types_recipients = dict(Counter(
+        _MASK_TO_KEY[mask] if mask < 16 and mask.bit_count() == len(blood_compat)
+        else _recipient_key(blood_compat)
+        for mask, (blood_compat, _, _) in zip(R.compat.tolist(), recipients)
+    ))
     
     return {
         'n_donors': len(donors),
@@ -140,7 +531,13 @@ def analyze_network_structure(
 
 
 __all__ = [
+    "Donors",
+    "Recipients",
+    "to_soa",
     "validate_matching",
+    "make_validator",
+    "validate_matchings_batch",
     "count_compatible_pairs",
+    "count_compatible_pairs_threaded",
     "analyze_network_structure",
 ]
\ No newline at end of file